@@ -9,8 +9,8 @@ def calculate_monthly_payment(loan_amount, annual_rate, years=30):
     if monthly_rate == 0:
         return loan_amount / num_payments
 
-    payment = loan_amount * (monthly_rate * (1 + monthly_rate) ** num_payments) / \
-              ((1 + monthly_rate) ** num_payments - 1)
+    growth = (1 + monthly_rate) ** num_payments
+    payment = loan_amount * monthly_rate * growth / (growth - 1)
     return payment
 
 def breakdown_first_month(loan_amount, annual_rate, monthly_payment):
@@ -2,16 +2,21 @@
 Fetch TSLA minute-level historical data during market hours only
 Date Range: August 1-31, 2025
 Market Hours: 6:30 AM - 1:00 PM PDT (9:30 AM - 4:00 PM ET)
+Output: tsla_minute_data_august_2025.parquet (requires pyarrow)
 """
 
 import pandas as pd
-from datetime import datetime, timedelta
-import pytz
+import pyarrow as pa
+import pyarrow.parquet as pq
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 from alpaca.data.historical import StockHistoricalDataClient
 from alpaca.data.requests import StockBarsRequest
 from alpaca.data.timeframe import TimeFrame
-import time
 import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -24,107 +29,160 @@ API_SECRET = os.getenv('ALPACA_API_SECRET')
 if not API_KEY or not API_SECRET:
     raise ValueError("Please set ALPACA_API_KEY and ALPACA_API_SECRET in your .env file")
 
-def fetch_tsla_minute_data():
+# Time zones and market session boundaries (Eastern Time), resolved once
+ET_TZ = ZoneInfo('US/Eastern')
+PDT_TZ = ZoneInfo('US/Pacific')
+MARKET_OPEN_ET = '09:30'
+MARKET_CLOSE_ET = '16:00'
+
+# Output files
+PARQUET_OUTPUT_FILE = 'tsla_minute_data_august_2025.parquet'
+CSV_OUTPUT_FILE = 'tsla_minute_data_august_2025.csv'
+
+# Alpaca allows 200 data API requests per minute. A few weekly requests run
+# concurrently, and their start times are spaced out to honour that limit
+MAX_CONCURRENT_REQUESTS = 4
+REQUESTS_PER_MINUTE = 200
+_MIN_REQUEST_INTERVAL = 60.0 / REQUESTS_PER_MINUTE
+_rate_lock = threading.Lock()
+_next_request_at = 0.0
+
+def wait_for_request_slot():
+    """Block until another request can start without exceeding REQUESTS_PER_MINUTE"""
+    global _next_request_at
+    with _rate_lock:
+        now = time.monotonic()
+        start = max(now, _next_request_at)
+        _next_request_at = start + _MIN_REQUEST_INTERVAL
+    if start > now:
+        time.sleep(start - now)
+
+def fetch_chunk(client, chunk_start, chunk_end):
+    """
+    Fetch one date range of TSLA minute bars and keep market hours only
+    
+    Returns:
+        DataFrame with ticker/time/open/close/high/low/vwap columns, or None on error
+    """
+    print(f"Fetching data from {chunk_start.date()} to {chunk_end.date()}...")
+    
+    try:
+        # Create request for minute bars
+        request_params = StockBarsRequest(
+            symbol_or_symbols=["TSLA"],
+            timeframe=TimeFrame.Minute,
+            start=chunk_start,
+            end=chunk_end
+        )
+        
+        # Get the data once the rate limit allows another request
+        wait_for_request_slot()
+        bars = client.get_stock_bars(request_params)
+        
+        # Convert to DataFrame
+        df = bars.df
+        
+        # Handle multi-index columns if present
+        if isinstance(df.columns, pd.MultiIndex):
+            df = df["TSLA"]
+        
+        # Reset index to get timestamp as a column
+        df = df.reset_index()
+        
+        total_bars = len(df)
+        
+        # Alpaca returns tz-aware UTC timestamps; localize defensively if not
+        timestamps = pd.DatetimeIndex(df['timestamp'])
+        if timestamps.tz is None:
+            timestamps = timestamps.tz_localize(timezone.utc)
+        
+        # Index by Eastern Time and keep market hours (9:30 AM - 4:00 PM ET)
+        # in a single vectorized pass over the int64 timestamps
+        df = df.set_index(timestamps.tz_convert(ET_TZ))
+        df = df.between_time(MARKET_OPEN_ET, MARKET_CLOSE_ET, inclusive='left')
+        
+        # Slice the price columns as a block and add the PDT time column
+        chunk_df = df[['open', 'close', 'high', 'low', 'vwap']].reset_index(drop=True)
+        chunk_df.insert(0, 'time', df.index.tz_convert(PDT_TZ))
+        chunk_df.insert(0, 'ticker', 'TSLA')
+        
+        print(f"  {chunk_start.date()}: processed {total_bars} bars, kept {len(chunk_df)} market hours bars")
+        return chunk_df
+        
+    except Exception as e:
+        print(f"Error fetching data for {chunk_start.date()}: {e}")
+        return None
+
+def write_legacy_csv(result_df, output_file=CSV_OUTPUT_FILE):
+    """
+    Write the legacy CSV (PDT time as 'YYYY-MM-DD HH:MM:SS' strings) using
+    pyarrow's multithreaded CSV writer
+    """
+    import pyarrow.csv as pacsv
+    
+    csv_df = result_df.assign(time=result_df['time'].dt.strftime('%Y-%m-%d %H:%M:%S'))
+    table = pa.Table.from_pandas(csv_df, preserve_index=False)
+    pacsv.write_csv(table, output_file, write_options=pacsv.WriteOptions(include_header=True))
+    print(f"✅ Legacy CSV saved to {output_file}")
+
+def fetch_tsla_minute_data(write_csv=False):
     """
     Fetch TSLA minute-level data for August 2025 during market hours only
+    
+    Args:
+        write_csv: Also write the legacy CSV file for older consumers
     """
     print("Initializing Alpaca client...")
     client = StockHistoricalDataClient(API_KEY, API_SECRET)
     
-    # Define time zones
-    et_tz = pytz.timezone('US/Eastern')
-    pdt_tz = pytz.timezone('US/Pacific')
-    
     # Date range for August 2025
     start_date = datetime(2025, 8, 1)
     end_date = datetime(2025, 8, 31, 23, 59, 59)
     
     print(f"Fetching TSLA minute data from {start_date.date()} to {end_date.date()}...")
     
-    # Initialize list to store all data
-    all_data = []
-    
-    # Fetch data in chunks (Alpaca has limits on data per request)
+    # Split the range into weekly chunks (Alpaca has limits on data per request)
+    date_ranges = []
     current_date = start_date
-    
     while current_date <= end_date:
-        # Process one week at a time to avoid API limits
         chunk_end = min(current_date + timedelta(days=7), end_date)
-        
-        print(f"Fetching data from {current_date.date()} to {chunk_end.date()}...")
-        
-        try:
-            # Create request for minute bars
-            request_params = StockBarsRequest(
-                symbol_or_symbols=["TSLA"],
-                timeframe=TimeFrame.Minute,
-                start=current_date,
-                end=chunk_end
-            )
-            
-            # Get the data
-            bars = client.get_stock_bars(request_params)
-            
-            # Convert to DataFrame
-            df = bars.df
-            
-            # Handle multi-index columns if present
-            if isinstance(df.columns, pd.MultiIndex):
-                df = df["TSLA"]
-            
-            # Reset index to get timestamp as a column
-            df = df.reset_index()
-            
-            # Process each bar
-            for _, row in df.iterrows():
-                # Convert timestamp to ET first (Alpaca returns UTC)
-                timestamp_utc = row['timestamp']
-                if timestamp_utc.tzinfo is None:
-                    timestamp_utc = pytz.UTC.localize(timestamp_utc)
-                else:
-                    timestamp_utc = timestamp_utc.astimezone(pytz.UTC)
-                
-                # Convert to Eastern Time
-                timestamp_et = timestamp_utc.astimezone(et_tz)
-                
-                # Check if it's during market hours (9:30 AM - 4:00 PM ET)
-                market_open = timestamp_et.replace(hour=9, minute=30, second=0, microsecond=0)
-                market_close = timestamp_et.replace(hour=16, minute=0, second=0, microsecond=0)
-                
-                if market_open <= timestamp_et < market_close:
-                    # Convert to PDT for output
-                    timestamp_pdt = timestamp_utc.astimezone(pdt_tz)
-                    
-                    # Add to our data list
-                    all_data.append({
-                        'ticker': 'TSLA',
-                        'time': timestamp_pdt.strftime('%Y-%m-%d %H:%M:%S'),
-                        'open': row['open'],
-                        'close': row['close'],
-                        'high': row['high'],
-                        'low': row['low'],
-                        'vwap': row['vwap']
-                    })
-            
-            print(f"  Processed {len(df)} bars, kept {len(all_data)} market hours bars so far")
-            
-            # Small delay to avoid rate limiting
-            time.sleep(0.5)
-            
-        except Exception as e:
-            print(f"Error fetching data for {current_date.date()}: {e}")
-        
-        # Move to next chunk
+        date_ranges.append((current_date, chunk_end))
         current_date = chunk_end + timedelta(seconds=1)
     
-    # Create DataFrame from all collected data
-    result_df = pd.DataFrame(all_data)
+    # Fetch all chunks concurrently and stream each one to the Parquet file as
+    # it arrives (map() yields in chronological order) instead of holding the
+    # whole range in memory
+    output_file = PARQUET_OUTPUT_FILE
+    writer = None
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            results = executor.map(
+                lambda date_range: fetch_chunk(client, *date_range),
+                date_ranges
+            )
+            for chunk_df in results:
+                if chunk_df is None:
+                    continue
+                table = pa.Table.from_pandas(chunk_df, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_file, table.schema, compression='snappy')
+                writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
     
-    # Save to CSV
-    output_file = 'tsla_minute_data_august_2025.csv'
-    result_df.to_csv(output_file, index=False)
+    if writer is None:
+        # Nothing fetched - still write an empty file with the expected columns
+        empty_df = pd.DataFrame(columns=['ticker', 'time', 'open', 'close', 'high', 'low', 'vwap'])
+        empty_df.to_parquet(output_file, engine='pyarrow', compression='snappy', index=False)
     
     print(f"\n✅ Data saved to {output_file}")
+    
+    # Load the written dataset back for the summary below
+    result_df = pd.read_parquet(output_file)
+    if write_csv:
+        write_legacy_csv(result_df)
+    
     print(f"Total records: {len(result_df)}")
     
     # Display sample of the data
@@ -145,4 +203,11 @@ def fetch_tsla_minute_data():
     return result_df
 
 if __name__ == "__main__":
-    df = fetch_tsla_minute_data()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Fetch TSLA minute data for August 2025")
+    parser.add_argument("--csv", action="store_true",
+                        help=f"Also write the legacy {CSV_OUTPUT_FILE} file")
+    args = parser.parse_args()
+    
+    df = fetch_tsla_minute_data(write_csv=args.csv)
@@ -2,15 +2,44 @@
 Verify and analyze the fetched TSLA minute data
 """
 
+import os
 import pandas as pd
 from datetime import datetime
 
+PARQUET_FILE = 'tsla_minute_data_august_2025.parquet'
+CSV_FILE = 'tsla_minute_data_august_2025.csv'
+# Prices stay float64 so the printed sample rows keep their exact values
+CSV_DTYPES = {
+    'ticker': 'category',
+    'open': 'float64',
+    'close': 'float64',
+    'high': 'float64',
+    'low': 'float64',
+    'vwap': 'float64',
+}
+
+def load_tsla_data():
+    """
+    Load the TSLA minute data, preferring the Parquet output of the fetch script
+    and falling back to the legacy CSV file
+    """
+    if os.path.exists(PARQUET_FILE):
+        return pd.read_parquet(PARQUET_FILE)
+    
+    # Multithreaded pyarrow parser, dates parsed once, explicit dtypes
+    return pd.read_csv(
+        CSV_FILE,
+        engine='pyarrow',
+        parse_dates=['time'],
+        dtype=CSV_DTYPES
+    )
+
 def verify_tsla_data():
     """
-    Verify the TSLA minute data CSV file
+    Verify the TSLA minute data file
     """
-    # Read the CSV file
-    df = pd.read_csv('tsla_minute_data_august_2025.csv')
+    # Read the data file
+    df = load_tsla_data()
     
     print("=" * 60)
     print("TSLA MINUTE DATA VERIFICATION")
@@ -21,22 +50,20 @@ def verify_tsla_data():
     print(f"Total records: {len(df):,}")
     print(f"Columns: {', '.join(df.columns)}")
     
-    # Convert time to datetime for analysis
-    df['time'] = pd.to_datetime(df['time'])
-    
     # Date range
     print(f"\n📅 Date Range:")
     print(f"Start: {df['time'].min()}")
     print(f"End: {df['time'].max()}")
     
-    # Extract hour from time for market hours verification
-    df['hour'] = df['time'].dt.hour
-    df['minute'] = df['time'].dt.minute
+    # Time of day as an offset from midnight, for market hours verification
+    time_of_day = df['time'] - df['time'].dt.normalize()
+    earliest_minutes = int(time_of_day.min().total_seconds() // 60)
+    latest_minutes = int(time_of_day.max().total_seconds() // 60)
     
     # Check market hours (should be 6:30 AM - 1:00 PM PDT)
     print(f"\n⏰ Market Hours Check (PDT):")
-    print(f"Earliest time in day: {df['hour'].min()}:{df['minute'][df['hour'] == df['hour'].min()].min():02d}")
-    print(f"Latest time in day: {df['hour'].max()}:{df['minute'][df['hour'] == df['hour'].max()].max():02d}")
+    print(f"Earliest time in day: {earliest_minutes // 60}:{earliest_minutes % 60:02d}")
+    print(f"Latest time in day: {latest_minutes // 60}:{latest_minutes % 60:02d}")
     
     # Trading days
     df['date'] = df['time'].dt.date
@@ -4,16 +4,142 @@ Using correct ATR calculation: High - Low
 Using moving median instead of moving average
 """
 
+import os
 import pandas as pd
 import numpy as np
 
-# Load the TSLA minute data
-df = pd.read_csv('tsla_minute_data_august_2025.csv')
-df['time'] = pd.to_datetime(df['time'])
-df['date'] = df['time'].dt.date
-
-# Calculate daily prices
-daily_prices = df.groupby('date').agg({
+# Numba is optional; without it the pandas rolling median is used instead
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+# Indexed binary heaps over positions into the value array. sign=-1.0 turns
+# the min-heap into a max-heap; pos[i] is the slot of index i in its heap.
+@njit(cache=True)
+def _heap_sift_up(heap, pos, values, sign, k):
+    while k > 0:
+        parent = (k - 1) // 2
+        if sign * values[heap[k]] >= sign * values[heap[parent]]:
+            break
+        heap[k], heap[parent] = heap[parent], heap[k]
+        pos[heap[k]] = k
+        pos[heap[parent]] = parent
+        k = parent
+
+
+@njit(cache=True)
+def _heap_sift_down(heap, size, pos, values, sign, k):
+    while True:
+        smallest = k
+        left = 2 * k + 1
+        right = left + 1
+        if left < size and sign * values[heap[left]] < sign * values[heap[smallest]]:
+            smallest = left
+        if right < size and sign * values[heap[right]] < sign * values[heap[smallest]]:
+            smallest = right
+        if smallest == k:
+            break
+        heap[k], heap[smallest] = heap[smallest], heap[k]
+        pos[heap[k]] = k
+        pos[heap[smallest]] = smallest
+        k = smallest
+
+
+@njit(cache=True)
+def _heap_push(heap, size, pos, values, sign, idx):
+    heap[size] = idx
+    pos[idx] = size
+    _heap_sift_up(heap, pos, values, sign, size)
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_remove(heap, size, pos, values, sign, k):
+    size -= 1
+    if k < size:
+        heap[k] = heap[size]
+        pos[heap[k]] = k
+        _heap_sift_up(heap, pos, values, sign, k)
+        _heap_sift_down(heap, size, pos, values, sign, k)
+    return size
+
+
+@njit(cache=True)
+def rolling_median_heaps(values, window, min_periods=1):
+    """
+    Rolling median in O(N log W) using a max-heap (lower half) and a min-heap
+    (upper half). Matches Series.rolling(window, min_periods).median(),
+    NaN inputs are skipped.
+    """
+    n = len(values)
+    out = np.empty(n, dtype=np.float64)
+    lo = np.empty(window, dtype=np.int64)
+    hi = np.empty(window, dtype=np.int64)
+    which = np.full(n, -1, dtype=np.int64)  # 0 = lo heap, 1 = hi heap, -1 = neither
+    pos = np.zeros(n, dtype=np.int64)
+    lo_size = 0
+    hi_size = 0
+    
+    for i in range(n):
+        # Drop the value leaving the window
+        old = i - window
+        if old >= 0 and which[old] != -1:
+            if which[old] == 0:
+                lo_size = _heap_remove(lo, lo_size, pos, values, -1.0, pos[old])
+            else:
+                hi_size = _heap_remove(hi, hi_size, pos, values, 1.0, pos[old])
+            which[old] = -1
+        
+        # Insert the new value into the half it belongs to
+        if not np.isnan(values[i]):
+            if hi_size > 0 and values[i] > values[hi[0]]:
+                hi_size = _heap_push(hi, hi_size, pos, values, 1.0, i)
+                which[i] = 1
+            else:
+                lo_size = _heap_push(lo, lo_size, pos, values, -1.0, i)
+                which[i] = 0
+        
+        # Rebalance so lo holds the extra element when the count is odd
+        while lo_size > hi_size + 1:
+            idx = lo[0]
+            lo_size = _heap_remove(lo, lo_size, pos, values, -1.0, 0)
+            hi_size = _heap_push(hi, hi_size, pos, values, 1.0, idx)
+            which[idx] = 1
+        while hi_size > lo_size:
+            idx = hi[0]
+            hi_size = _heap_remove(hi, hi_size, pos, values, 1.0, 0)
+            lo_size = _heap_push(lo, lo_size, pos, values, -1.0, idx)
+            which[idx] = 0
+        
+        count = lo_size + hi_size
+        if count < min_periods or count == 0:
+            out[i] = np.nan
+        elif count % 2 == 1:
+            out[i] = values[lo[0]]
+        else:
+            out[i] = (values[lo[0]] + values[hi[0]]) / 2.0
+    
+    return out
+
+PARQUET_FILE = 'tsla_minute_data_august_2025.parquet'
+CSV_FILE = 'tsla_minute_data_august_2025.csv'
+
+# Load the TSLA minute data (Parquet preferred, legacy CSV as fallback)
+if os.path.exists(PARQUET_FILE):
+    df = pd.read_parquet(PARQUET_FILE)
+else:
+    df = pd.read_csv(CSV_FILE)
+    df['time'] = pd.to_datetime(df['time'])
+df['date'] = df['time'].dt.floor('D')
+
+# Calculate daily prices (datetime64 group key keeps the Cython groupby path)
+daily_prices = df.groupby('date', sort=False, observed=True).agg({
     'open': 'first',
     'close': 'last',
     'high': 'max',
@@ -26,7 +152,10 @@ daily_prices.columns = ['date', 'daily_open', 'daily_close', 'daily_high', 'dail
 daily_prices['intraday_atr'] = daily_prices['daily_high'] - daily_prices['daily_low']
 
 # Calculate 20-day moving median
-daily_prices['atr_median20'] = daily_prices['intraday_atr'].rolling(window=20, min_periods=1).median()
+if NUMBA_AVAILABLE:
+    daily_prices['atr_median20'] = rolling_median_heaps(daily_prices['intraday_atr'].to_numpy(dtype=np.float64), 20, 1)
+else:
+    daily_prices['atr_median20'] = daily_prices['intraday_atr'].rolling(window=20, min_periods=1).median()
 
 # Also calculate moving average for comparison
 daily_prices['atr_ma20'] = daily_prices['intraday_atr'].rolling(window=20, min_periods=1).mean()
@@ -34,6 +163,11 @@ daily_prices['atr_ma20'] = daily_prices['intraday_atr'].rolling(window=20, min_p
 # Calculate ATR as percentage
 daily_prices['atr_pct'] = (daily_prices['intraday_atr'] / daily_prices['daily_close']) * 100
 
+# Summary statistics for every reported column in one aggregation
+stats = daily_prices[['intraday_atr', 'atr_median20', 'daily_close', 'atr_pct']].agg(
+    ['min', 'max', 'mean', 'median', 'std']
+)
+
 # Display results
 print("=" * 60)
 print("TSLA INTRADAY ATR ANALYSIS - KEY RESULTS")
@@ -43,17 +177,17 @@ print(f"\nData Period: August 2025")
 print(f"Total Trading Days: {len(daily_prices)}")
 
 print("\n📊 DAILY ATR STATISTICS (High - Low):")
-print(f"  Mean ATR: ${daily_prices['intraday_atr'].mean():.2f}")
-print(f"  Median ATR: ${daily_prices['intraday_atr'].median():.2f}")
-print(f"  Max ATR: ${daily_prices['intraday_atr'].max():.2f}")
-print(f"  Min ATR: ${daily_prices['intraday_atr'].min():.2f}")
-print(f"  Std Dev: ${daily_prices['intraday_atr'].std():.2f}")
+print(f"  Mean ATR: ${stats.loc['mean', 'intraday_atr']:.2f}")
+print(f"  Median ATR: ${stats.loc['median', 'intraday_atr']:.2f}")
+print(f"  Max ATR: ${stats.loc['max', 'intraday_atr']:.2f}")
+print(f"  Min ATR: ${stats.loc['min', 'intraday_atr']:.2f}")
+print(f"  Std Dev: ${stats.loc['std', 'intraday_atr']:.2f}")
 
 print("\n📈 20-DAY MOVING MEDIAN ATR:")
 print(f"  Current (Last Day): ${daily_prices['atr_median20'].iloc[-1]:.2f}")
-print(f"  Average of Medians: ${daily_prices['atr_median20'].mean():.2f}")
-print(f"  Max: ${daily_prices['atr_median20'].max():.2f}")
-print(f"  Min: ${daily_prices['atr_median20'].min():.2f}")
+print(f"  Average of Medians: ${stats.loc['mean', 'atr_median20']:.2f}")
+print(f"  Max: ${stats.loc['max', 'atr_median20']:.2f}")
+print(f"  Min: ${stats.loc['min', 'atr_median20']:.2f}")
 
 print("\n📊 COMPARISON: MEDIAN vs MEAN:")
 print(f"  20-Day Moving Median (Last): ${daily_prices['atr_median20'].iloc[-1]:.2f}")
@@ -64,25 +198,31 @@ print("\n📅 LAST 5 DAYS DETAIL:")
 print("-" * 70)
 print(f"{'Date':<12} {'High':<8} {'Low':<8} {'ATR':<8} {'ATR%':<8} {'20-Median':<10}")
 print("-" * 70)
-for _, row in daily_prices.tail(5).iterrows():
-    print(f"{str(row['date']):<12} ${row['daily_high']:<7.2f} ${row['daily_low']:<7.2f} ${row['intraday_atr']:<7.2f} {row['atr_pct']:<7.2f}% ${row['atr_median20']:<9.2f}")
+for row in daily_prices.tail(5).itertuples(index=False):
+    print(f"{str(row.date.date()):<12} ${row.daily_high:<7.2f} ${row.daily_low:<7.2f} ${row.intraday_atr:<7.2f} {row.atr_pct:<7.2f}% ${row.atr_median20:<9.2f}")
 
 # Volatility analysis
-avg_price = daily_prices['daily_close'].mean()
-atr_pct_mean = daily_prices['atr_pct'].mean()
+avg_price = stats.loc['mean', 'daily_close']
+atr_pct_mean = stats.loc['mean', 'atr_pct']
+
+# Count days above each ATR threshold with a single sort of the ATR column
+atr = daily_prices['intraday_atr'].to_numpy()
+n_days = len(atr)
+atr_thresholds = [15, 20, 25]
+days_above = n_days - np.searchsorted(np.sort(atr), atr_thresholds, side='right')
 
 print("\n💡 VOLATILITY INSIGHTS:")
 print(f"  ATR as % of Average Price: {atr_pct_mean:.2f}%")
-print(f"  Days with ATR > $15: {len(daily_prices[daily_prices['intraday_atr'] > 15])} ({len(daily_prices[daily_prices['intraday_atr'] > 15])/len(daily_prices)*100:.1f}%)")
-print(f"  Days with ATR > $20: {len(daily_prices[daily_prices['intraday_atr'] > 20])} ({len(daily_prices[daily_prices['intraday_atr'] > 20])/len(daily_prices)*100:.1f}%)")
-print(f"  Days with ATR > $25: {len(daily_prices[daily_prices['intraday_atr'] > 25])} ({len(daily_prices[daily_prices['intraday_atr'] > 25])/len(daily_prices)*100:.1f}%)")
+for threshold, count in zip(atr_thresholds, days_above):
+    print(f"  Days with ATR > ${threshold}: {count} ({count/n_days*100:.1f}%)")
 
 # Compare with open-close range
 daily_prices['open_close_range'] = abs(daily_prices['daily_close'] - daily_prices['daily_open'])
+open_close_mean = daily_prices['open_close_range'].mean()
 print("\n📐 ATR vs OPEN-CLOSE RANGE:")
-print(f"  Mean ATR (High-Low): ${daily_prices['intraday_atr'].mean():.2f}")
-print(f"  Mean Open-Close Range: ${daily_prices['open_close_range'].mean():.2f}")
-print(f"  Ratio (ATR/Open-Close): {daily_prices['intraday_atr'].mean() / daily_prices['open_close_range'].mean():.2f}x")
+print(f"  Mean ATR (High-Low): ${stats.loc['mean', 'intraday_atr']:.2f}")
+print(f"  Mean Open-Close Range: ${open_close_mean:.2f}")
+print(f"  Ratio (ATR/Open-Close): {stats.loc['mean', 'intraday_atr'] / open_close_mean:.2f}x")
 
 print("\n" + "=" * 60)
 print("Analysis complete! Check 'tsla_intraday_atr_analysis.ipynb' for")
@@ -6,6 +6,8 @@ This script provides comprehensive methods to explore and visualize Alpaca tradi
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.collections import PolyCollection
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime
@@ -115,24 +117,45 @@ def create_visualizations(barset, symbol="AAPL"):
     
     # Handle multi-symbol DataFrames
     if isinstance(df.columns, pd.MultiIndex):
-        symbol_df = df[symbol].copy()
+        symbol_df = df[symbol]
     else:
-        symbol_df = df.copy()
-    
-    # Calculate technical indicators
-    symbol_df['MA_5'] = symbol_df['close'].rolling(window=5).mean()
-    symbol_df['MA_20'] = symbol_df['close'].rolling(window=20).mean()
-    symbol_df['daily_return'] = symbol_df['close'].pct_change()
+        symbol_df = df
     
-    # Bollinger Bands
-    rolling_mean = symbol_df['close'].rolling(window=20).mean()
-    rolling_std = symbol_df['close'].rolling(window=20).std()
-    symbol_df['BB_upper'] = rolling_mean + (rolling_std * 2)
-    symbol_df['BB_lower'] = rolling_mean - (rolling_std * 2)
+    # Calculate technical indicators and Bollinger Bands in one assign(),
+    # which builds a single new frame instead of inserting columns one by one
+    close = symbol_df['close']
+    rolling_mean = close.rolling(window=20).mean()
+    rolling_std = close.rolling(window=20).std()
+    symbol_df = symbol_df.assign(
+        MA_5=close.rolling(window=5).mean(),
+        MA_20=rolling_mean,
+        daily_return=close.pct_change(),
+        BB_upper=rolling_mean + (rolling_std * 2),
+        BB_lower=rolling_mean - (rolling_std * 2),
+    )
     
     # Reset index to have timestamp as a column
     symbol_df = symbol_df.reset_index()
     
+    # Materialize every plotted column as a NumPy array once and pass the
+    # arrays to plotly/matplotlib instead of re-converting Series per call
+    timestamps = symbol_df['timestamp']
+    if timestamps.dt.tz is not None:
+        timestamps = timestamps.dt.tz_convert(None)
+    ts = timestamps.to_numpy()
+    open_prices = symbol_df['open'].to_numpy()
+    high = symbol_df['high'].to_numpy()
+    low = symbol_df['low'].to_numpy()
+    close = symbol_df['close'].to_numpy()
+    volume = symbol_df['volume'].to_numpy(dtype=float)
+    vwap = symbol_df['vwap'].to_numpy()
+    trade_count = symbol_df['trade_count'].to_numpy()
+    ma_5 = symbol_df['MA_5'].to_numpy()
+    ma_20 = symbol_df['MA_20'].to_numpy()
+    bb_upper = symbol_df['BB_upper'].to_numpy()
+    bb_lower = symbol_df['BB_lower'].to_numpy()
+    daily_return = symbol_df['daily_return'].to_numpy()
+    
     # 1. Interactive Candlestick Chart with Plotly
     fig = make_subplots(
         rows=3, cols=1,
@@ -145,11 +168,11 @@ def create_visualizations(barset, symbol="AAPL"):
     # Candlestick
     fig.add_trace(
         go.Candlestick(
-            x=symbol_df['timestamp'],
-            open=symbol_df['open'],
-            high=symbol_df['high'],
-            low=symbol_df['low'],
-            close=symbol_df['close'],
+            x=ts,
+            open=open_prices,
+            high=high,
+            low=low,
+            close=close,
             name='OHLC'
         ),
         row=1, col=1
@@ -158,8 +181,8 @@ def create_visualizations(barset, symbol="AAPL"):
     # Moving Averages
     fig.add_trace(
         go.Scatter(
-            x=symbol_df['timestamp'],
-            y=symbol_df['MA_5'],
+            x=ts,
+            y=ma_5,
             name='MA 5',
             line=dict(color='orange', width=1)
         ),
@@ -168,8 +191,8 @@ def create_visualizations(barset, symbol="AAPL"):
     
     fig.add_trace(
         go.Scatter(
-            x=symbol_df['timestamp'],
-            y=symbol_df['MA_20'],
+            x=ts,
+            y=ma_20,
             name='MA 20',
             line=dict(color='blue', width=1)
         ),
@@ -179,8 +202,8 @@ def create_visualizations(barset, symbol="AAPL"):
     # Bollinger Bands
     fig.add_trace(
         go.Scatter(
-            x=symbol_df['timestamp'],
-            y=symbol_df['BB_upper'],
+            x=ts,
+            y=bb_upper,
             name='BB Upper',
             line=dict(color='gray', width=0.5),
             opacity=0.3
@@ -190,8 +213,8 @@ def create_visualizations(barset, symbol="AAPL"):
     
     fig.add_trace(
         go.Scatter(
-            x=symbol_df['timestamp'],
-            y=symbol_df['BB_lower'],
+            x=ts,
+            y=bb_lower,
             name='BB Lower',
             line=dict(color='gray', width=0.5),
             fill='tonexty',
@@ -202,13 +225,12 @@ def create_visualizations(barset, symbol="AAPL"):
     )
     
     # Volume
-    colors = ['red' if row['close'] < row['open'] else 'green' 
-              for _, row in symbol_df.iterrows()]
+    colors = np.where(close < open_prices, 'red', 'green')
     
     fig.add_trace(
         go.Bar(
-            x=symbol_df['timestamp'],
-            y=symbol_df['volume'],
+            x=ts,
+            y=volume,
             name='Volume',
             marker_color=colors,
             showlegend=False
@@ -217,11 +239,11 @@ def create_visualizations(barset, symbol="AAPL"):
     )
     
     # Daily Returns
-    return_colors = ['red' if r < 0 else 'green' for r in symbol_df['daily_return']]
+    return_colors = np.where(daily_return < 0, 'red', 'green')
     fig.add_trace(
         go.Bar(
-            x=symbol_df['timestamp'],
-            y=symbol_df['daily_return'] * 100,
+            x=ts,
+            y=daily_return * 100,
             name='Daily Return %',
             marker_color=return_colors,
             showlegend=False
@@ -253,10 +275,10 @@ def create_visualizations(barset, symbol="AAPL"):
     
     # Price and Moving Averages
     ax1 = axes[0, 0]
-    ax1.plot(symbol_df['timestamp'], symbol_df['close'], label='Close Price', linewidth=2)
-    ax1.plot(symbol_df['timestamp'], symbol_df['MA_5'], label='MA 5', alpha=0.7)
-    ax1.plot(symbol_df['timestamp'], symbol_df['MA_20'], label='MA 20', alpha=0.7)
-    ax1.fill_between(symbol_df['timestamp'], symbol_df['BB_lower'], symbol_df['BB_upper'], 
+    ax1.plot(ts, close, label='Close Price', linewidth=2)
+    ax1.plot(ts, ma_5, label='MA 5', alpha=0.7)
+    ax1.plot(ts, ma_20, label='MA 20', alpha=0.7)
+    ax1.fill_between(ts, bb_lower, bb_upper, 
                      alpha=0.1, color='gray', label='Bollinger Bands')
     ax1.set_title('Price with Technical Indicators')
     ax1.set_xlabel('Date')
@@ -264,9 +286,22 @@ def create_visualizations(barset, symbol="AAPL"):
     ax1.legend()
     ax1.grid(True, alpha=0.3)
     
-    # Volume
+    # Volume - drawn as one PolyCollection instead of one Rectangle per bar
     ax2 = axes[0, 1]
-    ax2.bar(symbol_df['timestamp'], symbol_df['volume'], color=colors, alpha=0.7)
+    x = mdates.date2num(ts)
+    bar_width = 0.8 * np.min(np.diff(x)) if len(x) > 1 else 0.8
+    left = x - bar_width / 2
+    right = x + bar_width / 2
+    zeros = np.zeros_like(volume)
+    verts = np.stack([
+        np.column_stack([left, zeros]),
+        np.column_stack([left, volume]),
+        np.column_stack([right, volume]),
+        np.column_stack([right, zeros]),
+    ], axis=1)
+    ax2.add_collection(PolyCollection(verts, facecolors=colors, alpha=0.7))
+    ax2.autoscale_view()
+    ax2.xaxis_date()
     ax2.set_title('Trading Volume')
     ax2.set_xlabel('Date')
     ax2.set_ylabel('Volume')
@@ -274,7 +309,7 @@ def create_visualizations(barset, symbol="AAPL"):
     
     # Daily Returns Distribution
     ax3 = axes[1, 0]
-    returns = symbol_df['daily_return'].dropna()
+    returns = daily_return[~np.isnan(daily_return)]
     ax3.hist(returns * 100, bins=30, edgecolor='black', alpha=0.7)
     ax3.axvline(x=0, color='red', linestyle='--', alpha=0.5)
     ax3.set_title('Daily Returns Distribution')
@@ -284,15 +319,15 @@ def create_visualizations(barset, symbol="AAPL"):
     
     # Add statistics text
     mean_return = returns.mean() * 100
-    std_return = returns.std() * 100
+    std_return = returns.std(ddof=1) * 100
     ax3.text(0.05, 0.95, f'Mean: {mean_return:.3f}%\nStd: {std_return:.3f}%', 
              transform=ax3.transAxes, verticalalignment='top',
              bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
     
     # Cumulative Returns
     ax4 = axes[1, 1]
-    cumulative_returns = (1 + returns).cumprod() - 1
-    ax4.plot(symbol_df['timestamp'][1:], cumulative_returns * 100, linewidth=2)
+    cumulative_returns = np.cumprod(1 + returns) - 1
+    ax4.plot(ts[1:], cumulative_returns * 100, linewidth=2)
     ax4.set_title('Cumulative Returns')
     ax4.set_xlabel('Date')
     ax4.set_ylabel('Cumulative Return (%)')
@@ -300,7 +335,7 @@ def create_visualizations(barset, symbol="AAPL"):
     
     # Price vs Volume Scatter
     ax5 = axes[2, 0]
-    scatter = ax5.scatter(symbol_df['volume'], symbol_df['close'], 
+    scatter = ax5.scatter(volume, close, 
                          c=range(len(symbol_df)), cmap='viridis', alpha=0.6)
     ax5.set_title('Price vs Volume Relationship')
     ax5.set_xlabel('Volume')
@@ -310,8 +345,8 @@ def create_visualizations(barset, symbol="AAPL"):
     
     # VWAP vs Close Price
     ax6 = axes[2, 1]
-    ax6.plot(symbol_df['timestamp'], symbol_df['close'], label='Close', alpha=0.7)
-    ax6.plot(symbol_df['timestamp'], symbol_df['vwap'], label='VWAP', alpha=0.7)
+    ax6.plot(ts, close, label='Close', alpha=0.7)
+    ax6.plot(ts, vwap, label='VWAP', alpha=0.7)
     ax6.set_title('Close Price vs VWAP')
     ax6.set_xlabel('Date')
     ax6.set_ylabel('Price ($)')
@@ -320,9 +355,9 @@ def create_visualizations(barset, symbol="AAPL"):
     
     # High-Low Spread
     ax7 = axes[3, 0]
-    spread = symbol_df['high'] - symbol_df['low']
-    ax7.plot(symbol_df['timestamp'], spread, linewidth=1, color='purple')
-    ax7.fill_between(symbol_df['timestamp'], 0, spread, alpha=0.3, color='purple')
+    spread = high - low
+    ax7.plot(ts, spread, linewidth=1, color='purple')
+    ax7.fill_between(ts, 0, spread, alpha=0.3, color='purple')
     ax7.set_title('Daily High-Low Spread')
     ax7.set_xlabel('Date')
     ax7.set_ylabel('Spread ($)')
@@ -330,7 +365,7 @@ def create_visualizations(barset, symbol="AAPL"):
     
     # Trade Count
     ax8 = axes[3, 1]
-    ax8.plot(symbol_df['timestamp'], symbol_df['trade_count'], linewidth=1, color='brown')
+    ax8.plot(ts, trade_count, linewidth=1, color='brown')
     ax8.set_title('Number of Trades per Day')
     ax8.set_xlabel('Date')
     ax8.set_ylabel('Trade Count')
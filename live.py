@@ -1,3 +1,6 @@
+import asyncio
+import collections
+import sys
 from alpaca.data.live import StockDataStream
 import os
 from dotenv import load_dotenv
@@ -16,8 +19,28 @@ stream = StockDataStream(
     API_SECRET
 )
 
+# Quotes are buffered and written to stdout in batches so printing never
+# stalls the stream's event loop. When the buffer is full the oldest
+# quotes are dropped.
+FLUSH_INTERVAL_SECONDS = 0.1
+quote_buffer = collections.deque(maxlen=4096)
+flusher_task = None
+
+async def flush_quotes():
+    """Drain the quote buffer to stdout with a single write per interval"""
+    while True:
+        await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+        if quote_buffer:
+            drained = [quote_buffer.popleft() for _ in range(len(quote_buffer))]
+            sys.stdout.write('\n'.join(map(str, drained)) + '\n')
+            sys.stdout.flush()
+
 async def handle_trade(data):
-    print(data)
+    global flusher_task
+    # stream.run() owns the event loop, so start the flusher on first use
+    if flusher_task is None:
+        flusher_task = asyncio.create_task(flush_quotes())
+    quote_buffer.append(data)
 
 stream.subscribe_quotes(handle_trade, "SNAP")
 stream.run()
@@ -1,16 +1,33 @@
 # ping.py
 import os
+import atexit
+import json
 import logging
+import random
 import socket
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, Optional
 
-import requests
-from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    MaxRetryError,
+    NewConnectionError,
+    ProtocolError,
+    ReadTimeoutError,
+    SSLError,
+)
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Optional: prefer IPv4 to avoid IPv6 blackholes
 # System-wide way is /etc/gai.conf, but this is a simple process-level nudge:
-requests.packages.urllib3.util.connection.HAS_IPV6 = False  # type: ignore[attr-defined]
+urllib3.util.connection.HAS_IPV6 = False  # type: ignore[attr-defined]
 LOG_FILE = "ping.log"
 log = logging.getLogger(__name__)
 def setup_logger() -> None:
@@ -23,28 +40,58 @@ def setup_logger() -> None:
 PING_URL = os.getenv("PING_URL", "https://aisenseapi.com/services/v1/ping")
 DEFAULT_TIMEOUT = (5, 10)  # (connect_timeout, read_timeout) seconds
 
-def _session() -> requests.Session:
-    s = requests.Session()
-
-    # Retry on transient network / TLS / 5xx errors
-    retry = Retry(
-        total=5,
-        connect=5,
-        read=5,
-        backoff_factor=0.5,                  # exponential backoff: 0.5, 1, 2, 4...
-        status_forcelist=(429, 500, 502, 503, 504),
-        allowed_methods=frozenset(["GET","POST","PUT","DELETE","HEAD","OPTIONS","TRACE"]),
-        raise_on_status=False,
-        respect_retry_after_header=True,
+# PING_URL is fixed for the life of the process, so parse it once and talk to
+# its connection pool directly instead of re-resolving the URL on every call
+_PING_PARSED = urllib3.util.parse_url(PING_URL)
+_PATH = _PING_PARSED.request_uri
+
+BACKOFF_MAX = 30  # seconds
+
+class JitteredRetry(Retry):
+    """Retry whose exponential backoff is stretched by a random 0-50% so
+    many failing clients don't retry in lockstep"""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return min(BACKOFF_MAX, backoff * (1 + random.uniform(0, 0.5)))
+
+# Retry on transient network / TLS / 5xx errors. The policy is static, so it is
+# built once at import (Retry is immutable - each attempt derives a new copy)
+_RETRY = JitteredRetry(
+    total=5,
+    connect=5,
+    read=5,
+    backoff_factor=0.5,                  # exponential backoff: 0.5, 1, 2, 4... (+0-50% jitter)
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET","POST","PUT","DELETE","HEAD","OPTIONS","TRACE"]),
+    raise_on_status=False,
+    respect_retry_after_header=True,
+)
+_TIMEOUT = urllib3.Timeout(connect=DEFAULT_TIMEOUT[0], read=DEFAULT_TIMEOUT[1])
+
+def _pool() -> urllib3.HTTPConnectionPool:
+    # Note: unlike requests, a bare urllib3 pool does not read HTTPS_PROXY/NO_PROXY.
+    return urllib3.connection_from_url(
+        PING_URL,
+        maxsize=10,
+        retries=_RETRY,
+        timeout=_TIMEOUT,
     )
 
-    adapter = HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=10)
-    s.mount("https://", adapter)
-    s.mount("http://", adapter)
+# One shared pool so repeated pings reuse keep-alive connections
+_POOL: Optional[urllib3.HTTPConnectionPool] = None
+_POOL_LOCK = threading.Lock()
 
-    # Optional: if you have a corporate proxy, requests respects HTTPS_PROXY/NO_PROXY env vars.
-    # Ensure NO_PROXY includes your internal hosts if needed.
-    return s
+def _get_pool() -> urllib3.HTTPConnectionPool:
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = _pool()
+                atexit.register(_POOL.close)
+    return _POOL
 
 def call_ping_api() -> Dict[str, Any]:
     headers = {
@@ -53,22 +100,29 @@ def call_ping_api() -> Dict[str, Any]:
     }
 
     try:
-        with _session() as s:
-            resp = s.get(PING_URL, headers=headers, timeout=DEFAULT_TIMEOUT)
-            resp.raise_for_status()
-            return resp.json() if "application/json" in resp.headers.get("content-type","").lower() else {"text": resp.text}
+        try:
+            resp = _get_pool().urlopen("GET", _PATH, headers=headers, preload_content=True)
+        except MaxRetryError as e:
+            # Surface the underlying failure so it is logged by type below
+            raise (e.reason or e) from e
+        if resp.status >= 400:
+            raise urllib3.exceptions.HTTPError(f"HTTP {resp.status} from {PING_URL}")
+        if "application/json" in resp.headers.get("content-type","").lower():
+            # orjson parses the raw bytes directly, skipping the str decode
+            return orjson.loads(resp.data) if ORJSON_AVAILABLE else json.loads(resp.data)
+        return {"text": resp.data.decode("utf-8", errors="replace")}
 
-    except requests.exceptions.SSLError as e:
+    except SSLError as e:
         # TLS-level error (certs, handshake). Log the root cause.
         log.exception("TLS handshake failed: %s", e)
         raise
-    except (requests.exceptions.ConnectTimeout, requests.exceptions.ReadTimeout) as e:
-        log.exception("Network timeout connecting to %s: %s", PING_URL, e)
-        raise
-    except requests.exceptions.ConnectionError as e:
+    except (NewConnectionError, ProtocolError) as e:
         # DNS issues, refused connections, IPv6 blackholes, etc.
         log.exception("Connection error to %s: %s", PING_URL, e)
         raise
+    except (ConnectTimeoutError, ReadTimeoutError) as e:
+        log.exception("Network timeout connecting to %s: %s", PING_URL, e)
+        raise
     except Exception as e:
         log.exception("Unexpected error calling %s: %s", PING_URL, e)
         raise
@@ -80,4 +134,4 @@ def main():
 
 if __name__ == "__main__":
     setup_logger()
-    main()
\ No newline at end of file
+    main()
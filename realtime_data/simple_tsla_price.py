@@ -5,15 +5,37 @@ A minimal example for getting real-time TSLA stock prices
 
 import os
 import time
+import threading
+import asyncio
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import pytz
 from dotenv import load_dotenv
 from alpaca.data.historical import StockHistoricalDataClient
 from alpaca.data.requests import StockLatestQuoteRequest, StockLatestTradeRequest
+from alpaca.data.live import StockDataStream
+from alpaca.trading.client import TradingClient
 
 # Load environment variables
 load_dotenv()
 
+# Quote and trade requests are independent, so issue them side by side
+_EXEC = ThreadPoolExecutor(max_workers=2)
+
+# One data client (and its pooled HTTPS session) shared by every polling tick
+_CLIENT = None
+_LOCK = threading.Lock()
+
+
+def _client(api_key, api_secret):
+    """Return the shared StockHistoricalDataClient, creating it on first use"""
+    global _CLIENT
+    if _CLIENT is None:
+        with _LOCK:
+            if _CLIENT is None:
+                _CLIENT = StockHistoricalDataClient(api_key, api_secret)
+    return _CLIENT
+
 def get_tsla_price():
     """Get current TSLA price from Alpaca API"""
     
@@ -25,26 +47,26 @@ def get_tsla_price():
         print("Error: Please set ALPACA_API_KEY and ALPACA_API_SECRET in your .env file")
         return None
     
-    # Create data client
-    client = StockHistoricalDataClient(api_key, api_secret)
+    # Reuse the shared data client
+    client = _client(api_key, api_secret)
     
     try:
-        # Get latest quote
+        # Get latest quote and trade concurrently
         quote_request = StockLatestQuoteRequest(symbol_or_symbols="TSLA")
-        quote = client.get_stock_latest_quote(quote_request)
-        
-        # Get latest trade
         trade_request = StockLatestTradeRequest(symbol_or_symbols="TSLA")
-        trade = client.get_stock_latest_trade(trade_request)
+        f_q = _EXEC.submit(client.get_stock_latest_quote, quote_request)
+        f_t = _EXEC.submit(client.get_stock_latest_trade, trade_request)
+        quote = f_q.result()
+        trade = f_t.result()
         
         if "TSLA" in quote and "TSLA" in trade:
             quote_data = quote["TSLA"]
             trade_data = trade["TSLA"]
             
             # Extract prices
-            bid_price = float(quote_data.bid_price) if quote_data.bid_price else 0
-            ask_price = float(quote_data.ask_price) if quote_data.ask_price else 0
-            last_price = float(trade_data.price) if trade_data.price else 0
+            bid_price = quote_data.bid_price or 0.0
+            ask_price = quote_data.ask_price or 0.0
+            last_price = trade_data.price or 0.0
             
             # Calculate spread
             spread = ask_price - bid_price if (ask_price and bid_price) else 0
@@ -84,28 +106,89 @@ def display_price(price_data):
     print(f"{'='*50}")
 
 
-def run_continuous(interval=1):
-    """Run continuous price updates"""
-    print(f"Starting TSLA real-time price monitor...")
-    print(f"Update interval: {interval} second(s)")
-    print("Press Ctrl+C to stop\n")
+def is_market_open():
+    """Check the Alpaca market clock (returns False if it cannot be reached)"""
+    try:
+        trading_client = TradingClient(os.getenv('ALPACA_API_KEY'), os.getenv('ALPACA_API_SECRET'), paper=True)
+        return trading_client.get_clock().is_open
+    except Exception as e:
+        print(f"Error checking market clock: {e}")
+        return False
+
+
+def print_inline(price_data):
+    """Print a single-line price update, overwriting the previous one"""
+    timestamp = price_data['timestamp'].strftime('%H:%M:%S')
+    print(f"\r[{timestamp}] TSLA: ${price_data['last_price']:.2f} | "
+          f"Bid: ${price_data['bid']:.2f} | "
+          f"Ask: ${price_data['ask']:.2f} | "
+          f"Spread: ${price_data['spread']:.2f}", end='', flush=True)
+
+
+async def stream_prices():
+    """
+    Push-based price updates over a single Alpaca WebSocket connection.
+    Quote and trade handlers feed one asyncio.Queue that drives the display.
+    """
+    stream = StockDataStream(os.getenv('ALPACA_API_KEY'), os.getenv('ALPACA_API_SECRET'))
+    updates = asyncio.Queue()
+    
+    async def quote_handler(data):
+        await updates.put(('quote', data))
     
+    async def trade_handler(data):
+        await updates.put(('trade', data))
+    
+    stream.subscribe_quotes(quote_handler, "TSLA")
+    stream.subscribe_trades(trade_handler, "TSLA")
+    stream_task = asyncio.create_task(stream._run_forever())
+    
+    price_data = {'last_price': 0, 'bid': 0, 'ask': 0, 'spread': 0}
     try:
         while True:
-            price_data = get_tsla_price()
-            
-            if price_data:
-                # Clear screen for cleaner display (optional)
-                # os.system('clear' if os.name == 'posix' else 'cls')
-                
-                # Display inline update
-                timestamp = price_data['timestamp'].strftime('%H:%M:%S')
-                print(f"\r[{timestamp}] TSLA: ${price_data['last_price']:.2f} | "
-                      f"Bid: ${price_data['bid']:.2f} | "
-                      f"Ask: ${price_data['ask']:.2f} | "
-                      f"Spread: ${price_data['spread']:.2f}", end='', flush=True)
+            kind, data = await updates.get()
+            if kind == 'quote':
+                price_data['bid'] = data.bid_price or 0.0
+                price_data['ask'] = data.ask_price or 0.0
+                price_data['spread'] = price_data['ask'] - price_data['bid'] if (price_data['ask'] and price_data['bid']) else 0
+            else:
+                price_data['last_price'] = data.price or 0.0
+            price_data['timestamp'] = datetime.now(pytz.timezone('America/Los_Angeles'))
+            print_inline(price_data)
+    finally:
+        stream_task.cancel()
+        await stream.close()
+
+
+def run_polling(interval=1):
+    """Poll the REST API every `interval` seconds (used when the market is closed)"""
+    while True:
+        price_data = get_tsla_price()
+        
+        if price_data:
+            # Clear screen for cleaner display (optional)
+            # os.system('clear' if os.name == 'posix' else 'cls')
             
-            time.sleep(interval)
+            # Display inline update
+            print_inline(price_data)
+        
+        time.sleep(interval)
+
+
+def run_continuous(interval=1):
+    """Run continuous price updates (streaming while the market is open)"""
+    print(f"Starting TSLA real-time price monitor...")
+    
+    try:
+        if is_market_open():
+            print("Market is open - streaming live updates over WebSocket")
+            print("Press Ctrl+C to stop\n")
+            asyncio.run(stream_prices())
+        else:
+            print("Market is closed - falling back to REST polling")
+            print(f"Update interval: {interval} second(s)")
+            print("Press Ctrl+C to stop\n")
+            run_polling(interval)
     
     except KeyboardInterrupt:
         print("\n\nStopped by user")
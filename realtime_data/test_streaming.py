@@ -3,10 +3,17 @@ Test script to verify Alpaca streaming API
 """
 
 import os
+import signal
 import asyncio
 from dotenv import load_dotenv
 from alpaca.data.live import StockDataStream
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -37,14 +44,34 @@ async def main():
     
     print("Starting stream... Press Ctrl+C to stop")
     
+    # Ctrl+C sets stop_event instead of raising KeyboardInterrupt mid-await
+    stop_event = asyncio.Event()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGINT, stop_event.set)
+    except NotImplementedError:
+        pass  # Windows - fall back to KeyboardInterrupt
+    
+    # Run the stream (run() starts its own event loop, so await _run_forever directly)
+    stream_task = asyncio.create_task(stream._run_forever())
+    stop_task = asyncio.create_task(stop_event.wait())
+    
     try:
-        # Run the stream
-        await stream.run()
+        await asyncio.wait({stream_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+        if stop_event.is_set():
+            print("\nStopping stream...")
+        else:
+            stream_task.result()
     except KeyboardInterrupt:
         print("\nStopping stream...")
     finally:
+        stream_task.cancel()
+        stop_task.cancel()
         await stream.close()
         print("Stream closed")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop when installed
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -4,10 +4,13 @@ Supports both polling and streaming modes with proper error handling
 """
 
 import os
+import csv
 import sys
 import time
 import logging
+import random
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import pytz
 from dotenv import load_dotenv
 from alpaca.data.historical import StockHistoricalDataClient
@@ -15,7 +18,7 @@ from alpaca.data.live import StockDataStream
 from alpaca.data.requests import StockLatestQuoteRequest, StockLatestTradeRequest
 from alpaca.trading.client import TradingClient
 from colorama import init, Fore, Style
-import pandas as pd
+import numpy as np
 import asyncio
 from typing import Optional
 
@@ -36,6 +39,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Polling issues the quote and trade requests side by side
+_EXEC = ThreadPoolExecutor(max_workers=2)
+
+# Streaming reconnects back off exponentially (with jitter) up to this cap
+RECONNECT_BACKOFF_BASE = 1.0  # seconds
+RECONNECT_BACKOFF_MAX = 30    # seconds
+AUTH_ERROR_MARKERS = ('auth failed', 'failed to authenticate', 'not authenticated', '401', '403', 'forbidden')
+
+
+def reconnect_delay(attempt):
+    """Exponential backoff stretched by a random 0-50% so clients don't reconnect in lockstep"""
+    return min(RECONNECT_BACKOFF_MAX, RECONNECT_BACKOFF_BASE * (2 ** attempt) * (1 + random.uniform(0, 0.5)))
+
 
 class TSLARealtimeTracker:
     def __init__(self, mode='polling', paper_trading=True):
@@ -62,9 +78,41 @@ class TSLARealtimeTracker:
         self.et = pytz.timezone('America/New_York')
         self.pdt = pytz.timezone('America/Los_Angeles')
         
-        # Data storage
-        self.price_history = []
+        # Data storage - fixed-size circular columns holding the most recent ticks
+        self._cap = 10_000
+        self._n = 0                                       # total ticks recorded
+        self._ts = np.empty(self._cap, np.int64)          # epoch nanoseconds
+        # Prices are stored as int32 cents; dollars are derived only for display
+        self._px = np.empty(self._cap, np.int32)
+        self._bid = np.empty(self._cap, np.int32)
+        self._ask = np.empty(self._cap, np.int32)
+        self._spread = np.empty(self._cap, np.int32)
+        self._bid_size = np.empty(self._cap, np.int32)
+        self._ask_size = np.empty(self._cap, np.int32)
+        self._trade_size = np.empty(self._cap, np.int32)
+        
+        # Running session statistics (cents), so the summary never needs every tick
+        self._px_first = 0
+        self._px_min = 0
+        self._px_max = 0
+        self._px_sum = 0
+        self._spread_sum = 0
         self.save_to_csv = False
+        self._csv_f = None
+        self._csv_w = None
+        
+        # Display clock - the ET time string is only re-rendered once per second
+        self._last_sec = 0
+        self._last_hms = ""
+        
+        # Display templates - the color codes are concatenated once, not per tick
+        def line_format(color, symbol):
+            return (f"\r\x1b[2K{Fore.CYAN}[%s] {Fore.WHITE}TSLA: {color}$%.2f {symbol} (%+.2f, %+.2f%%) "
+                    f"{Fore.BLUE}Bid: $%.2f {Fore.MAGENTA}Ask: $%.2f {Fore.YELLOW}Spread: $%.2f")
+        self._fmt_up = line_format(Fore.GREEN, "▲")
+        self._fmt_down = line_format(Fore.RED, "▼")
+        self._fmt_flat = line_format(Fore.YELLOW, "=")
+        self._fmt_first = line_format(Fore.WHITE, "•")
         
         # Initialize API clients
         self._setup_api_clients()
@@ -109,13 +157,13 @@ class TSLARealtimeTracker:
         """Handle incoming quote data from stream"""
         try:
             quote_data = {
-                'bid_price': float(data.bid_price) if data.bid_price else 0,
-                'ask_price': float(data.ask_price) if data.ask_price else 0,
+                'bid_price': data.bid_price or 0.0,
+                'ask_price': data.ask_price or 0.0,
                 'bid_size': data.bid_size,
                 'ask_size': data.ask_size,
                 'timestamp': data.timestamp
             }
-            self.display_price_update(quote_data)
+            self._enqueue_render(quote_data)
         except Exception as e:
             logger.error(f"Error handling quote: {e}")
     
@@ -123,22 +171,48 @@ class TSLARealtimeTracker:
         """Handle incoming trade data from stream"""
         try:
             trade_data = {
-                'price': float(data.price),
+                'price': data.price,
                 'size': data.size,
                 'timestamp': data.timestamp
             }
             # For trades, create a minimal quote
             quote_data = {
-                'bid_price': float(data.price) - 0.01,
-                'ask_price': float(data.price) + 0.01,
+                'bid_price': data.price - 0.01,
+                'ask_price': data.price + 0.01,
                 'bid_size': 0,
                 'ask_size': 0,
                 'timestamp': data.timestamp
             }
-            self.display_price_update(quote_data, trade_data)
+            self._enqueue_render(quote_data, trade_data)
         except Exception as e:
             logger.error(f"Error handling trade: {e}")
     
+    def _enqueue_render(self, quote_data, trade_data=None):
+        """Queue an update for the renderer; when full the oldest update is dropped"""
+        if self._render_q.full():
+            self._render_q.get_nowait()
+        self._render_q.put_nowait((quote_data, trade_data))
+    
+    async def _renderer(self):
+        """Drain queued updates and render them in a worker thread, so terminal writes never stall the WebSocket loop"""
+        while True:
+            item = await self._render_q.get()
+            if item is None:
+                # Stop sentinel from _stop_renderer; everything before it has been rendered
+                break
+            quote_data, trade_data = item
+            try:
+                await asyncio.to_thread(self.display_price_update, quote_data, trade_data)
+            except Exception as e:
+                logger.error(f"Error rendering update: {e}")
+    
+    async def _stop_renderer(self, renderer):
+        """Queue the stop sentinel and wait until the renderer, including an in-flight render, has finished"""
+        if self._render_q.full():
+            self._render_q.get_nowait()
+        self._render_q.put_nowait(None)
+        await renderer
+    
     def get_latest_quote(self):
         """Get the latest quote for TSLA (polling method)"""
         try:
@@ -148,8 +222,8 @@ class TSLARealtimeTracker:
             if self.symbol in quote:
                 quote_data = quote[self.symbol]
                 return {
-                    'bid_price': float(quote_data.bid_price) if quote_data.bid_price else 0,
-                    'ask_price': float(quote_data.ask_price) if quote_data.ask_price else 0,
+                    'bid_price': quote_data.bid_price or 0.0,
+                    'ask_price': quote_data.ask_price or 0.0,
                     'bid_size': quote_data.bid_size,
                     'ask_size': quote_data.ask_size,
                     'timestamp': quote_data.timestamp
@@ -168,7 +242,7 @@ class TSLARealtimeTracker:
             if self.symbol in trade:
                 trade_data = trade[self.symbol]
                 return {
-                    'price': float(trade_data.price),
+                    'price': trade_data.price,
                     'size': trade_data.size,
                     'timestamp': trade_data.timestamp
                 }
@@ -179,7 +253,11 @@ class TSLARealtimeTracker:
     
     def display_price_update(self, quote_data: dict, trade_data: Optional[dict] = None):
         """Display formatted price update in console"""
-        timestamp = datetime.now(self.et)
+        now_ns = time.time_ns()
+        sec = now_ns // 1_000_000_000
+        if sec != self._last_sec:
+            self._last_hms = datetime.fromtimestamp(sec, self.et).strftime('%H:%M:%S')
+            self._last_sec = sec
         
         # Calculate spread
         bid = quote_data.get('bid_price', 0)
@@ -192,33 +270,22 @@ class TSLARealtimeTracker:
         # Calculate price change
         price_change = 0
         price_change_pct = 0
-        color = Fore.WHITE
+        template = self._fmt_first
         
         if self.last_price and last_price:
             price_change = last_price - self.last_price
             price_change_pct = (price_change / self.last_price) * 100
             
             if price_change > 0:
-                color = Fore.GREEN
-                symbol = "▲"
+                template = self._fmt_up
             elif price_change < 0:
-                color = Fore.RED
-                symbol = "▼"
+                template = self._fmt_down
             else:
-                color = Fore.YELLOW
-                symbol = "="
-        else:
-            symbol = "•"
+                template = self._fmt_flat
         
         # Clear line and display update
-        print(f"\r{' ' * 100}", end='')  # Clear line
-        print(f"\r{Fore.CYAN}[{timestamp.strftime('%H:%M:%S')}] "
-              f"{Fore.WHITE}TSLA: "
-              f"{color}${last_price:.2f} {symbol} "
-              f"({price_change:+.2f}, {price_change_pct:+.2f}%) "
-              f"{Fore.BLUE}Bid: ${bid:.2f} "
-              f"{Fore.MAGENTA}Ask: ${ask:.2f} "
-              f"{Fore.YELLOW}Spread: ${spread:.2f}", end='', flush=True)
+        sys.stdout.write(template % (self._last_hms, last_price, price_change, price_change_pct, bid, ask, spread))
+        sys.stdout.flush()
         
         # Update last price
         self.last_price = last_price
@@ -226,16 +293,33 @@ class TSLARealtimeTracker:
         self.last_ask = ask
         
         # Store in history
-        self.price_history.append({
-            'timestamp': timestamp,
-            'last_price': last_price,
-            'bid': bid,
-            'ask': ask,
-            'spread': spread,
-            'bid_size': quote_data.get('bid_size', 0),
-            'ask_size': quote_data.get('ask_size', 0),
-            'trade_size': trade_data.get('size', 0) if trade_data else 0
-        })
+        i = self._n % self._cap
+        self._ts[i] = now_ns
+        bid_cents = int(round(bid * 100))
+        ask_cents = int(round(ask * 100))
+        self._px[i] = int(round(last_price * 100))
+        self._bid[i] = bid_cents
+        self._ask[i] = ask_cents
+        self._spread[i] = ask_cents - bid_cents if (ask_cents and bid_cents) else 0
+        self._bid_size[i] = quote_data.get('bid_size', 0) or 0
+        self._ask_size[i] = quote_data.get('ask_size', 0) or 0
+        self._trade_size[i] = (trade_data.get('size', 0) or 0) if trade_data else 0
+        
+        px_cents = int(self._px[i])
+        if self._n == 0:
+            self._px_first = self._px_min = self._px_max = px_cents
+        elif px_cents < self._px_min:
+            self._px_min = px_cents
+        elif px_cents > self._px_max:
+            self._px_max = px_cents
+        self._px_sum += px_cents
+        self._spread_sum += int(self._spread[i])
+        self._n += 1
+        
+        # Append the row to the CSV as it arrives
+        if self._csv_w:
+            self._csv_w.writerow((now_ns, self._px[i], bid_cents, ask_cents, self._spread[i],
+                                  self._bid_size[i], self._ask_size[i], self._trade_size[i]))
     
     def run_polling(self, interval=1.0, duration=None):
         """
@@ -253,9 +337,11 @@ class TSLARealtimeTracker:
         
         try:
             while True:
-                # Get latest data
-                quote = self.get_latest_quote()
-                trade = self.get_latest_trade()
+                # Get latest data (quote and trade concurrently)
+                f_q = _EXEC.submit(self.get_latest_quote)
+                f_t = _EXEC.submit(self.get_latest_trade)
+                quote = f_q.result()
+                trade = f_t.result()
                 
                 if quote:
                     self.display_price_update(quote, trade)
@@ -279,11 +365,14 @@ class TSLARealtimeTracker:
         print(f"{Fore.YELLOW}Connecting to Alpaca WebSocket...")
         print(f"{Fore.CYAN}Press Ctrl+C to stop\n")
         
-        # Track connection attempts
-        max_retries = 3
-        retry_count = 0
+        # Handlers only enqueue; rendering happens in a separate consumer task
+        self._render_q = asyncio.Queue(maxsize=1024)
+        renderer = asyncio.create_task(self._renderer())
         
-        while retry_count < max_retries:
+        # Track connection attempts - transient errors retry indefinitely, auth errors abort
+        attempt = 0
+        
+        while True:
             try:
                 # Subscribe to TSLA quotes and trades with handler functions
                 self.stream_client.subscribe_quotes(self._handle_quote, self.symbol)
@@ -297,35 +386,35 @@ class TSLARealtimeTracker:
                 await self.stream_client._run_forever()
                 break  # If successful, exit the retry loop
                 
-            except ValueError as e:
-                if "connection limit exceeded" in str(e):
-                    retry_count += 1
-                    wait_time = 5 * retry_count  # Exponential backoff
-                    print(f"\n{Fore.YELLOW}Connection limit exceeded. Waiting {wait_time} seconds before retry {retry_count}/{max_retries}...")
-                    await asyncio.sleep(wait_time)
-                else:
-                    raise
             except KeyboardInterrupt:
                 print(f"\n\n{Fore.YELLOW}Stopping price tracker...")
                 break
             except Exception as e:
-                logger.error(f"Streaming error: {e}")
-                print(f"\n{Fore.RED}Streaming error: {e}")
-                retry_count += 1
-                if retry_count < max_retries:
-                    wait_time = 5 * retry_count
-                    print(f"{Fore.YELLOW}Retrying in {wait_time} seconds... (Attempt {retry_count}/{max_retries})")
-                    await asyncio.sleep(wait_time)
-                else:
-                    print(f"{Fore.RED}Max retries reached. Exiting.")
+                if any(marker in str(e).lower() for marker in AUTH_ERROR_MARKERS):
+                    logger.error(f"Streaming authentication failed: {e}")
+                    print(f"\n{Fore.RED}Authentication failed: {e}")
+                    print(f"{Fore.YELLOW}Check ALPACA_API_KEY and ALPACA_API_SECRET in your .env file.")
                     break
+                
+                wait_time = reconnect_delay(attempt)
+                attempt += 1
+                if "connection limit exceeded" in str(e):
+                    print(f"\n{Fore.YELLOW}Connection limit exceeded. Retrying in {wait_time:.1f} seconds... (Attempt {attempt})")
+                    print(f"{Fore.YELLOW}Close other streaming connections if this persists.")
+                else:
+                    logger.error(f"Streaming error: {e}")
+                    print(f"\n{Fore.RED}Streaming error: {e}")
+                    print(f"{Fore.YELLOW}Retrying in {wait_time:.1f} seconds... (Attempt {attempt})")
+                await asyncio.sleep(wait_time)
         
-        # Cleanup
+        # Cleanup: close the WebSocket so no more updates arrive, then let the
+        # renderer finish before the CSV is closed and the stats are read
         try:
             if hasattr(self.stream_client, '_ws') and self.stream_client._ws:
                 await self.stream_client._ws.close()
         except:
             pass
+        await self._stop_renderer(renderer)
         
         self._save_data_if_enabled()
         self._display_summary()
@@ -338,40 +427,48 @@ class TSLARealtimeTracker:
         else:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             self.csv_filename = f"tsla_prices_{timestamp}.csv"
+        
+        # Rows are streamed as they arrive (line buffered), so a killed run keeps its data
+        self._csv_f = open(self.csv_filename, 'w', newline='', buffering=1)
+        self._csv_w = csv.writer(self._csv_f)
+        self._csv_w.writerow(['timestamp_ns', 'last_price_cents', 'bid_cents', 'ask_cents', 'spread_cents',
+                              'bid_size', 'ask_size', 'trade_size'])
         print(f"{Fore.GREEN}CSV logging enabled: {self.csv_filename}")
     
     def _save_data_if_enabled(self):
         """Save collected data to CSV if enabled"""
-        if self.save_to_csv and self.price_history:
-            df = pd.DataFrame(self.price_history)
-            df.to_csv(self.csv_filename, index=False)
+        if self.save_to_csv and self._csv_f:
+            self._csv_f.flush()
+            self._csv_f.close()
+            self._csv_f = None
+            self._csv_w = None
             print(f"\n{Fore.GREEN}✓ Data saved to {self.csv_filename}")
-            print(f"  {len(self.price_history)} price points recorded")
+            print(f"  {self._n} price points recorded")
     
     def _display_summary(self):
         """Display summary statistics"""
-        if not self.price_history:
+        n = self._n
+        if not n:
             return
         
-        df = pd.DataFrame(self.price_history)
-        
         print(f"\n{Fore.CYAN}{'='*50}")
         print(f"{Fore.WHITE}TSLA Trading Session Summary")
         print(f"{Fore.CYAN}{'='*50}")
         
-        if 'last_price' in df.columns and len(df) > 0:
-            print(f"{Fore.WHITE}Price Range: ${df['last_price'].min():.2f} - ${df['last_price'].max():.2f}")
-            print(f"Average Price: ${df['last_price'].mean():.2f}")
-            print(f"Average Spread: ${df['spread'].mean():.2f}")
-            print(f"Total Updates: {len(df)}")
+        print(f"{Fore.WHITE}Price Range: ${self._px_min / 100.0:.2f} - ${self._px_max / 100.0:.2f}")
+        print(f"Average Price: ${self._px_sum / n / 100.0:.2f}")
+        print(f"Average Spread: ${self._spread_sum / n / 100.0:.2f}")
+        print(f"Total Updates: {n}")
+        
+        # Calculate session change
+        if n > 1:
+            px_last = int(self._px[(n - 1) % self._cap])
+            session_change = (px_last - self._px_first) / 100.0
+            # The first price is 0 when that update had no trade and no quote
+            pct_text = f"{(px_last - self._px_first) / self._px_first * 100:+.2f}%" if self._px_first else "N/A"
             
-            # Calculate session change
-            if len(df) > 1:
-                session_change = df['last_price'].iloc[-1] - df['last_price'].iloc[0]
-                session_change_pct = (session_change / df['last_price'].iloc[0]) * 100
-                
-                color = Fore.GREEN if session_change > 0 else Fore.RED
-                print(f"Session Change: {color}{session_change:+.2f} ({session_change_pct:+.2f}%)")
+            color = Fore.GREEN if session_change > 0 else Fore.RED
+            print(f"Session Change: {color}{session_change:+.2f} ({pct_text})")
 
 
 def main():
@@ -4,6 +4,7 @@ Works with the current alpaca-py library
 """
 
 import os
+import signal
 import asyncio
 from datetime import datetime
 import pytz
@@ -11,6 +12,12 @@ from dotenv import load_dotenv
 from alpaca.data.live import StockDataStream
 from colorama import init, Fore, Style
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Initialize colorama
 init(autoreset=True)
 
@@ -34,23 +41,48 @@ class TSLAStreamTracker:
         self.stream = StockDataStream(api_key, api_secret)
         
     async def handle_quote(self, data):
-        """Handle incoming quote data"""
+        """Handle incoming quote data (rendered by the consumer task)"""
+        self._enqueue(self._print_quote, data)
+    
+    async def handle_trade(self, data):
+        """Handle incoming trade data (rendered by the consumer task)"""
+        self._enqueue(self._print_trade, data)
+    
+    def _enqueue(self, render, data):
+        """Queue an update for rendering; when full the oldest update is dropped"""
+        if self._render_q.full():
+            self._render_q.get_nowait()
+        self._render_q.put_nowait((render, data))
+    
+    async def _renderer(self):
+        """Print queued updates from a worker thread so a slow terminal never stalls the WebSocket loop"""
+        while True:
+            render, data = await self._render_q.get()
+            try:
+                await asyncio.to_thread(render, data)
+            except Exception as e:
+                print(f"{Fore.RED}Render error: {e}")
+    
+    def _print_quote(self, data):
+        """Display a quote update"""
+        cyan, white, blue, magenta, yellow = Fore.CYAN, Fore.WHITE, Fore.BLUE, Fore.MAGENTA, Fore.YELLOW
         timestamp = datetime.now(self.et)
-        bid = float(data.bid_price) if data.bid_price else 0
-        ask = float(data.ask_price) if data.ask_price else 0
+        bid = data.bid_price or 0.0
+        ask = data.ask_price or 0.0
         spread = ask - bid if (ask and bid) else 0
         
         # Display quote
-        print(f"{Fore.CYAN}[{timestamp.strftime('%H:%M:%S')}] "
-              f"{Fore.WHITE}TSLA Quote: "
-              f"{Fore.BLUE}Bid: ${bid:.2f} "
-              f"{Fore.MAGENTA}Ask: ${ask:.2f} "
-              f"{Fore.YELLOW}Spread: ${spread:.2f}")
+        print(f"{cyan}[{timestamp.strftime('%H:%M:%S')}] "
+              f"{white}TSLA Quote: "
+              f"{blue}Bid: ${bid:.2f} "
+              f"{magenta}Ask: ${ask:.2f} "
+              f"{yellow}Spread: ${spread:.2f}")
     
-    async def handle_trade(self, data):
-        """Handle incoming trade data"""
+    def _print_trade(self, data):
+        """Display a trade update"""
+        cyan, white, green = Fore.CYAN, Fore.WHITE, Fore.GREEN
         timestamp = datetime.now(self.et)
-        price = float(data.price)
+        price = data.price
         size = data.size
         
         # Calculate price change
@@ -59,7 +91,7 @@ class TSLAStreamTracker:
             change_pct = (change / self.last_price) * 100
             
             if change > 0:
-                color = Fore.GREEN
+                color = green
                 symbol = "▲"
             elif change < 0:
                 color = Fore.RED
@@ -73,10 +105,10 @@ class TSLAStreamTracker:
             change_str = ""
         
         # Display trade
-        print(f"{Fore.CYAN}[{timestamp.strftime('%H:%M:%S')}] "
-              f"{Fore.WHITE}TSLA Trade: "
-              f"{Fore.GREEN}${price:.2f} "
-              f"{Fore.WHITE}Size: {size} "
+        print(f"{cyan}[{timestamp.strftime('%H:%M:%S')}] "
+              f"{white}TSLA Trade: "
+              f"{green}${price:.2f} "
+              f"{white}Size: {size} "
               f"{change_str}")
         
         self.last_price = price
@@ -87,20 +119,39 @@ class TSLAStreamTracker:
         print(f"{Fore.YELLOW}Connecting to Alpaca WebSocket...")
         print(f"{Fore.CYAN}Press Ctrl+C to stop\n")
         
+        # Handlers only enqueue; a separate consumer task does the printing
+        self._render_q = asyncio.Queue(maxsize=1024)
+        renderer = asyncio.create_task(self._renderer())
+        
         # Subscribe to TSLA data
         self.stream.subscribe_quotes(self.handle_quote, self.symbol)
         self.stream.subscribe_trades(self.handle_trade, self.symbol)
         
         print(f"{Fore.GREEN}✓ Subscribed to {self.symbol} real-time data\n")
         
+        # Ctrl+C sets stop_event instead of raising KeyboardInterrupt mid-await
+        stop_event = asyncio.Event()
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGINT, stop_event.set)
+        except NotImplementedError:
+            pass  # Windows - KeyboardInterrupt is still caught in __main__
+        
+        # Use _run_forever directly instead of run()
+        stream_task = asyncio.create_task(self.stream._run_forever())
+        stop_task = asyncio.create_task(stop_event.wait())
+        
         try:
-            # Use _run_forever directly instead of run()
-            await self.stream._run_forever()
-        except KeyboardInterrupt:
-            print(f"\n\n{Fore.YELLOW}Stopping stream...")
+            await asyncio.wait({stream_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+            if stop_event.is_set():
+                print(f"\n\n{Fore.YELLOW}Stopping stream...")
+            else:
+                stream_task.result()
         except Exception as e:
             print(f"\n{Fore.RED}Error: {e}")
         finally:
+            stream_task.cancel()
+            stop_task.cancel()
+            renderer.cancel()
             if hasattr(self.stream, '_ws') and self.stream._ws:
                 await self.stream._ws.close()
             print(f"{Fore.GREEN}Stream closed")
@@ -111,8 +162,11 @@ async def main():
     await tracker.run()
 
 if __name__ == "__main__":
-    # Run the async main function
+    # Run the async main function (on uvloop when installed)
     try:
-        asyncio.run(main())
+        if UVLOOP_AVAILABLE:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print(f"\n{Fore.YELLOW}Program terminated by user")
@@ -3,6 +3,9 @@ Configuration file for TQQQ Trading Bot
 Modify these settings to customize the bot's behavior
 """
 
+import functools
+from types import MappingProxyType
+
 # Trading Configuration
 TRADING_CONFIG = {
     'symbol': 'TQQQ',                    # Symbol to trade
@@ -81,9 +84,15 @@ PERFORMANCE_CONFIG = {
     'report_format': 'csv',             # 'csv', 'json', or 'both'
 }
 
+@functools.lru_cache(maxsize=1)
 def get_config():
-    """Return the complete configuration dictionary"""
-    return {
+    """
+    Return the complete configuration dictionary
+    
+    Built once and cached as a read-only mapping; call get_config.cache_clear()
+    after changing the module-level settings (e.g. in tests).
+    """
+    return MappingProxyType({
         'trading': TRADING_CONFIG,
         'notifications': NOTIFICATION_CONFIG,
         'email': EMAIL_CONFIG,
@@ -92,10 +101,28 @@ def get_config():
         'advanced': ADVANCED_CONFIG,
         'backtest': BACKTEST_CONFIG,
         'performance': PERFORMANCE_CONFIG,
-    }
+    })
+
+# Last validation result, keyed by the settings it depends on
+_last_key = None
+_last_errors = None
 
 def validate_config():
-    """Validate configuration settings"""
+    """Validate configuration settings (cached until a checked setting changes)"""
+    global _last_key, _last_errors
+    
+    key = (
+        TRADING_CONFIG['entry_time']['hour'],
+        TRADING_CONFIG['market_open_time']['hour'],
+        TRADING_CONFIG['exit_time']['hour'],
+        TRADING_CONFIG['quantity'],
+        TRADING_CONFIG['max_position_size'],
+        TRADING_CONFIG['stop_loss_percent'],
+        TRADING_CONFIG['take_profit_percent'],
+    )
+    if key == _last_key:
+        return list(_last_errors)
+    
     errors = []
     
     # Validate trading times
@@ -119,7 +146,8 @@ def validate_config():
     if TRADING_CONFIG['take_profit_percent'] and TRADING_CONFIG['take_profit_percent'] <= 0:
         errors.append("Take profit percentage must be positive")
     
-    return errors
+    _last_key, _last_errors = key, errors
+    return list(errors)
 
 if __name__ == "__main__":
     # Test configuration validation
@@ -135,4 +163,4 @@ if __name__ == "__main__":
     import json
     config = get_config()
     print("\nCurrent Configuration:")
-    print(json.dumps(config, indent=2, default=str))
+    print(json.dumps(dict(config), indent=2, default=str))
@@ -5,10 +5,23 @@ Provides desktop notifications, console alerts, and logging
 
 import os
 import sys
+import atexit
 import logging
+import subprocess
+import time
+import types
 from datetime import datetime
 import platform
 
+# Platform, resolved once at import
+_PLATFORM = platform.system()
+IS_MACOS = _PLATFORM == 'Darwin'
+IS_LINUX = _PLATFORM == 'Linux'
+IS_WINDOWS = _PLATFORM == 'Windows'
+
+if IS_WINDOWS:
+    import winsound
+
 # Try to import notification libraries
 try:
     from plyer import notification as desktop_notification
@@ -19,19 +32,65 @@ except ImportError:
 
 # For macOS, try to import pync
 PYNC_AVAILABLE = False
-if platform.system() == 'Darwin':
+if IS_MACOS:
     try:
         import pync
         PYNC_AVAILABLE = True
     except ImportError:
         pass
 
-# For macOS, we can also use osascript for notifications
-IS_MACOS = platform.system() == 'Darwin'
+# For macOS, we can also use osascript for notifications (see IS_MACOS)
 
 logger = logging.getLogger(__name__)
 
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Market status notification titles and default messages
+_STATUS_MESSAGES = types.MappingProxyType({
+    'OPEN': ('🟢 Market Open', 'Trading session has started'),
+    'CLOSED': ('🔴 Market Closed', 'Trading session has ended'),
+    'OPENING_SOON': ('🟡 Market Opening Soon', 'Prepare for trading'),
+    'CLOSING_SOON': ('🟡 Market Closing Soon', 'Positions will be closed soon')
+})
+
+# One-pass escaping for text embedded in AppleScript string literals
+_APPLESCRIPT_ESCAPES = str.maketrans({'\n': ' ', '\\': '\\\\', '"': '\\"', "'": "\\'"})
+
+# ANSI color codes for console output
+_COLORS = types.SimpleNamespace(
+    HEADER='\033[95m',
+    BLUE='\033[94m',
+    CYAN='\033[96m',
+    GREEN='\033[92m',
+    WARNING='\033[93m',
+    FAIL='\033[91m',
+    ENDC='\033[0m',
+    BOLD='\033[1m',
+    UNDERLINE='\033[4m',
+)
+
 class NotificationHandler:
+    # Console separators, built once
+    SEP_EQ = '=' * 60
+    SEP_DASH = '-' * 60
+    
+    # Console color selection: urgency first, then the first matching title keyword
+    _URGENCY_COLOR = {'critical': _COLORS.FAIL}
+    _TITLE_COLORS = (
+        ('Error', _COLORS.FAIL),
+        ('Failed', _COLORS.FAIL),
+        ('BUY', _COLORS.GREEN),
+        ('SELL', _COLORS.WARNING),
+        ('Summary', _COLORS.CYAN),
+    )
+    
+    def __new__(cls, enable_desktop=True, enable_console=True, enable_sound=True):
+        # Console-only configurations get the specialized handler below
+        desktop_active = enable_desktop and (DESKTOP_NOTIFICATIONS_AVAILABLE or IS_MACOS)
+        if cls is NotificationHandler and enable_console and not desktop_active and not enable_sound:
+            cls = ConsoleOnlyNotificationHandler
+        return super().__new__(cls)
+    
     def __init__(self, enable_desktop=True, enable_console=True, enable_sound=True):
         """
         Initialize notification handler
@@ -44,25 +103,17 @@ class NotificationHandler:
         self.enable_desktop = enable_desktop and (DESKTOP_NOTIFICATIONS_AVAILABLE or IS_MACOS)
         self.enable_console = enable_console
         self.enable_sound = enable_sound
-        
-        # ANSI color codes for console output
-        self.COLORS = {
-            'HEADER': '\033[95m',
-            'BLUE': '\033[94m',
-            'CYAN': '\033[96m',
-            'GREEN': '\033[92m',
-            'WARNING': '\033[93m',
-            'FAIL': '\033[91m',
-            'ENDC': '\033[0m',
-            'BOLD': '\033[1m',
-            'UNDERLINE': '\033[4m'
-        }
+        self._any_channel_enabled = self.enable_console or self.enable_desktop or self.enable_sound
         
         # Create notifications log file in logs directory
         log_dir = os.path.join(os.path.dirname(__file__), 'logs')
         os.makedirs(log_dir, exist_ok=True)
         self.log_file = os.path.join(log_dir, f"notifications_{datetime.now().strftime('%Y%m%d')}.log")
         
+        # Keep the log open (line buffered) instead of reopening it per notification
+        self._log_fh = open(self.log_file, 'a', buffering=1, encoding='utf-8')
+        atexit.register(self.close)
+        
     def send_notification(self, title, message, urgency='normal'):
         """
         Send notification through multiple channels
@@ -72,11 +123,15 @@ class NotificationHandler:
             message: Notification message
             urgency: 'low', 'normal', or 'critical'
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = time.strftime(TIMESTAMP_FORMAT)
         
         # Log to file
         self._log_to_file(timestamp, title, message)
         
+        # Logging-only mode
+        if not self._any_channel_enabled:
+            return
+        
         # Console notification
         if self.enable_console:
             self._console_notification(title, message, urgency)
@@ -87,37 +142,36 @@ class NotificationHandler:
         
         # Sound alert for critical notifications (with small delay to avoid conflicts)
         if self.enable_sound and urgency == 'critical':
-            import time
             time.sleep(0.1)  # Small delay to avoid conflicts with desktop notification
             self._play_sound()
     
     def _log_to_file(self, timestamp, title, message):
         """Log notification to file"""
-        with open(self.log_file, 'a') as f:
-            f.write(f"[{timestamp}] {title}\n")
-            f.write(f"{message}\n")
-            f.write("-" * 50 + "\n")
+        self._log_fh.write(f"[{timestamp}] {title}\n{message}\n{'-' * 50}\n")
+    
+    def close(self):
+        """Close the notification log file"""
+        if not self._log_fh.closed:
+            self._log_fh.close()
     
     def _console_notification(self, title, message, urgency):
         """Display colored console notification"""
         # Choose color based on urgency and title content
-        if urgency == 'critical' or 'Error' in title or 'Failed' in title:
-            color = self.COLORS['FAIL']
-        elif 'BUY' in title:
-            color = self.COLORS['GREEN']
-        elif 'SELL' in title:
-            color = self.COLORS['WARNING']
-        elif 'Summary' in title:
-            color = self.COLORS['CYAN']
-        else:
-            color = self.COLORS['BLUE']
+        color = self._URGENCY_COLOR.get(urgency)
+        if color is None:
+            color = _COLORS.BLUE
+            for needle, title_color in self._TITLE_COLORS:
+                if needle in title:
+                    color = title_color
+                    break
         
-        # Print formatted notification
-        print("\n" + "=" * 60)
-        print(f"{color}{self.COLORS['BOLD']}📢 {title}{self.COLORS['ENDC']}")
-        print("-" * 60)
-        print(f"{message}")
-        print("=" * 60 + "\n")
+        # Print formatted notification in a single write
+        sys.stdout.write(f"\n{self.SEP_EQ}\n"
+                         f"{color}{_COLORS.BOLD}📢 {title}{_COLORS.ENDC}\n"
+                         f"{self.SEP_DASH}\n"
+                         f"{message}\n"
+                         f"{self.SEP_EQ}\n\n")
+        sys.stdout.flush()
     
     def _desktop_notification(self, title, message):
         """Send desktop notification"""
@@ -184,23 +238,17 @@ class NotificationHandler:
             title = title[:100]  # Limit title length
             message = message[:256]  # Limit message length
             
-            # Escape quotes and special characters for AppleScript
+            # Escape quotes and special characters for the AppleScript string literals
+            # (no shell is involved - osascript receives the script as a single argv entry)
             # Also handle newlines which can break the AppleScript
-            title = title.replace('\n', ' ').replace('\\', '\\\\').replace('"', '\\"').replace("'", "\\'")
-            message = message.replace('\n', ' ').replace('\\', '\\\\').replace('"', '\\"').replace("'", "\\'")
+            title = title.translate(_APPLESCRIPT_ESCAPES)
+            message = message.translate(_APPLESCRIPT_ESCAPES)
             
-            # Create AppleScript command using double quotes for the outer shell command
             script = f'display notification "{message}" with title "{title}" sound name "Glass"'
             
-            # Execute AppleScript with proper escaping
-            import subprocess
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True, timeout=5)
-            
-            if result.returncode != 0:
-                logger.warning(f"osascript returned error: {result.stderr}")
-        except subprocess.TimeoutExpired:
-            logger.warning("macOS notification timed out")
+            # Fire and forget - the bot doesn't wait on the notification center
+            subprocess.Popen(['osascript', '-e', script], close_fds=True,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except Exception as e:
             logger.warning(f"Could not send macOS notification: {e}")
     
@@ -208,14 +256,18 @@ class NotificationHandler:
         """Play alert sound"""
         try:
             if IS_MACOS:
-                # Play system sound on macOS
-                os.system('afplay /System/Library/Sounds/Glass.aiff')
-            elif platform.system() == 'Linux':
-                # Use paplay or beep on Linux
-                os.system('paplay /usr/share/sounds/freedesktop/stereo/complete.oga 2>/dev/null || echo -e "\\a"')
-            elif platform.system() == 'Windows':
+                # Play system sound on macOS (no shell, not waited on)
+                subprocess.Popen(['afplay', '/System/Library/Sounds/Glass.aiff'],
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            elif IS_LINUX:
+                # Use paplay on Linux, or the terminal bell if it isn't installed
+                try:
+                    subprocess.Popen(['paplay', '/usr/share/sounds/freedesktop/stereo/complete.oga'],
+                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                except FileNotFoundError:
+                    print('\a')
+            elif IS_WINDOWS:
                 # Use winsound on Windows
-                import winsound
                 winsound.Beep(1000, 500)
             else:
                 # Fallback to terminal bell
@@ -275,19 +327,22 @@ class NotificationHandler:
             status: 'OPEN', 'CLOSED', 'OPENING_SOON', etc.
             details: Additional details
         """
-        status_messages = {
-            'OPEN': ('🟢 Market Open', 'Trading session has started'),
-            'CLOSED': ('🔴 Market Closed', 'Trading session has ended'),
-            'OPENING_SOON': ('🟡 Market Opening Soon', 'Prepare for trading'),
-            'CLOSING_SOON': ('🟡 Market Closing Soon', 'Positions will be closed soon')
-        }
-        
-        title, default_message = status_messages.get(status, ('Market Update', ''))
+        title, default_message = _STATUS_MESSAGES.get(status, ('Market Update', ''))
         message = details if details else default_message
         
         self.send_notification(title, message)
 
 
+class ConsoleOnlyNotificationHandler(NotificationHandler):
+    """NotificationHandler for console-only setups - no desktop or sound dispatch per alert"""
+    
+    def send_notification(self, title, message, urgency='normal'):
+        """Log the notification to file and print it to the console"""
+        timestamp = time.strftime(TIMESTAMP_FORMAT)
+        self._log_to_file(timestamp, title, message)
+        self._console_notification(title, message, urgency)
+
+
 # Test notifications if run directly
 if __name__ == "__main__":
     notifier = NotificationHandler()
@@ -7,11 +7,9 @@ Run this script to start the trading bot with proper configuration
 import sys
 import os
 import argparse
+import importlib.util
 from datetime import datetime
-import pytz
 from config import get_config, validate_config
-from tqqq_trading_bot import TQQQTradingBot
-from notifications import NotificationHandler
 
 def check_requirements():
     """Check if all required packages are installed"""
@@ -22,11 +20,10 @@ def check_requirements():
         'pandas': 'pandas'
     }
     
+    # find_spec only locates each package; it doesn't execute its import-time code
     missing_packages = []
     for module, package in required_packages.items():
-        try:
-            __import__(module)
-        except ImportError:
+        if importlib.util.find_spec(module) is None:
             missing_packages.append(package)
     
     if missing_packages:
@@ -39,44 +36,36 @@ def check_requirements():
     
     return True
 
-def check_env_file():
-    """Check if .env file exists and has required variables"""
-    from dotenv import load_dotenv
-    
-    # Try to find .env file in multiple locations
-    env_locations = []
-    
+# Resolved once at import
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_PARENT_DIR = os.path.dirname(_SCRIPT_DIR)
+
+def _env_candidates():
+    """Yield candidate .env locations in priority order"""
     # First priority: ENVROOT environment variable
     if os.environ.get('ENVROOT'):
-        env_locations.append(os.path.join(os.environ['ENVROOT'], '.env'))
+        yield os.path.join(os.environ['ENVROOT'], '.env')
     
     # Second priority: Parent directory (algo-trading)
-    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    env_locations.append(os.path.join(parent_dir, '.env'))
+    yield os.path.join(_PARENT_DIR, '.env')
     
     # Third priority: Current working directory
-    env_locations.append('.env')
+    yield '.env'
     
     # Fourth priority: Script directory
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    env_locations.append(os.path.join(script_dir, '.env'))
-    
-    # Try to load .env from each location
-    env_loaded = False
-    env_path = None
-    
-    for path in env_locations:
-        if os.path.exists(path):
-            print(f"📁 Found .env file at: {path}")
-            load_dotenv(path)
-            env_loaded = True
-            env_path = path
-            break
-    
-    if not env_loaded:
+    yield os.path.join(_SCRIPT_DIR, '.env')
+
+def check_env_file():
+    """Check if .env file exists and has required variables"""
+    from dotenv import load_dotenv
+    
+    # Stat candidates only until the first one exists
+    env_path = next((path for path in _env_candidates() if os.path.exists(path)), None)
+    
+    if env_path is None:
         print("❌ .env file not found!")
         print("\nSearched in the following locations:")
-        for path in env_locations:
+        for path in _env_candidates():
             print(f"  - {path}")
         print("\nPlease create a .env file with your Alpaca API credentials:")
         print("  ALPACA_API_KEY=your_api_key_here")
@@ -84,6 +73,9 @@ def check_env_file():
         print("\nYou can also set ENVROOT environment variable to specify the location.")
         return False
     
+    print(f"📁 Found .env file at: {env_path}")
+    load_dotenv(env_path)
+    
     # Check if credentials are present
     if not os.getenv('ALPACA_API_KEY') or not os.getenv('ALPACA_API_SECRET'):
         print(f"❌ API credentials not found in .env file at {env_path}!")
@@ -93,32 +85,43 @@ def check_env_file():
     print("✅ Environment variables loaded successfully")
     return True
 
-def display_status():
+# PDT timezone, loaded on first use (keeps pytz off the --help path)
+_PDT = None
+
+def display_status(config):
     """Display current bot status and configuration"""
-    config = get_config()
-    pdt = pytz.timezone('America/Los_Angeles')
-    now = datetime.now(pdt)
-    
-    print("\n" + "="*60)
-    print("🤖 TQQQ TRADING BOT STATUS")
-    print("="*60)
-    
-    print(f"\n📅 Current Time: {now.strftime('%Y-%m-%d %H:%M:%S %Z')}")
-    print(f"📊 Symbol: {config['trading']['symbol']}")
-    print(f"💰 Quantity per Trade: {config['trading']['quantity']} share(s)")
-    print(f"🏦 Mode: {'PAPER TRADING' if config['trading']['paper_trading'] else '⚠️ LIVE TRADING'}")
-    
-    print("\n⏰ Schedule:")
-    print(f"  • Market Open Capture: {config['trading']['market_open_time']['hour']:02d}:{config['trading']['market_open_time']['minute']:02d} PDT")
-    print(f"  • Entry Decision: {config['trading']['entry_time']['hour']:02d}:{config['trading']['entry_time']['minute']:02d} PDT")
-    print(f"  • Exit Position: {config['trading']['exit_time']['hour']:02d}:{config['trading']['exit_time']['minute']:02d} PDT")
-    
-    print("\n🔔 Notifications:")
-    print(f"  • Desktop: {'✅' if config['notifications']['enable_desktop'] else '❌'}")
-    print(f"  • Console: {'✅' if config['notifications']['enable_console'] else '❌'}")
-    print(f"  • Sound: {'✅' if config['notifications']['enable_sound'] else '❌'}")
-    
-    print("\n" + "="*60)
+    global _PDT
+    if _PDT is None:
+        import pytz
+        _PDT = pytz.timezone('America/Los_Angeles')
+    now = datetime.now(_PDT)
+    trading = config['trading']
+    notifications = config['notifications']
+    
+    # Build the whole banner and print it once
+    lines = [
+        "\n" + "="*60,
+        "🤖 TQQQ TRADING BOT STATUS",
+        "="*60,
+        "",
+        f"📅 Current Time: {now.strftime('%Y-%m-%d %H:%M:%S %Z')}",
+        f"📊 Symbol: {trading['symbol']}",
+        f"💰 Quantity per Trade: {trading['quantity']} share(s)",
+        f"🏦 Mode: {'PAPER TRADING' if trading['paper_trading'] else '⚠️ LIVE TRADING'}",
+        "",
+        "⏰ Schedule:",
+        f"  • Market Open Capture: {trading['market_open_time']['hour']:02d}:{trading['market_open_time']['minute']:02d} PDT",
+        f"  • Entry Decision: {trading['entry_time']['hour']:02d}:{trading['entry_time']['minute']:02d} PDT",
+        f"  • Exit Position: {trading['exit_time']['hour']:02d}:{trading['exit_time']['minute']:02d} PDT",
+        "",
+        "🔔 Notifications:",
+        f"  • Desktop: {'✅' if notifications['enable_desktop'] else '❌'}",
+        f"  • Console: {'✅' if notifications['enable_console'] else '❌'}",
+        f"  • Sound: {'✅' if notifications['enable_sound'] else '❌'}",
+        "",
+        "="*60,
+    ]
+    print("\n".join(lines))
 
 def main():
     """Main entry point for the trading bot"""
@@ -133,10 +136,12 @@ def main():
                        help='Force live trading mode (use with caution!)')
     
     args = parser.parse_args()
+    config = get_config()
     
     # Test notifications if requested
     if args.test_notifications:
         print("Testing notification system...")
+        from notifications import NotificationHandler
         notifier = NotificationHandler()
         notifier.send_notification("Test Alert", "TQQQ Bot notification test successful!")
         notifier.send_trade_alert("BUY", "TQQQ", 1, 45.67, "TEST123")
@@ -164,7 +169,7 @@ def main():
     print("✅ All checks passed!")
     
     # Display current status
-    display_status()
+    display_status(config)
     
     # Validate-only mode
     if args.validate_only:
@@ -172,7 +177,6 @@ def main():
         return
     
     # Determine trading mode
-    config = get_config()
     paper_trading = config['trading']['paper_trading']
     
     if args.paper:
@@ -196,18 +200,25 @@ def main():
     print("     - SELL 1 share if price <= open price (if position exists)")
     print("  3. Close any position at 12:59 PM PDT")
     
-    # Auto-start the bot without manual approval
-    print("\n🚀 Starting bot automatically in 3 seconds...")
-    print("   (Press Ctrl+C to cancel)")
-    
-    import time
-    for i in range(3, 0, -1):
-        print(f"   {i}...")
-        time.sleep(1)
+    # Auto-start the bot without manual approval; the cancel window only
+    # matters when someone is watching (skipped under cron/systemd/CI)
+    if sys.stdout.isatty():
+        print("\n🚀 Starting bot automatically in 3 seconds...")
+        print("   (Press Ctrl+C to cancel)")
+        
+        import time
+        for i in (3, 2, 1):
+            print(f"   {i}...")
+            time.sleep(1)
+    else:
+        print("\n🚀 Non-interactive; starting immediately")
     
     try:
         # Create and run the bot
         print("\n🤖 Starting TQQQ Trading Bot...")
+        # Imported late: pulls in alpaca/pandas, which --help and --validate-only don't need
+        from tqqq_trading_bot import TQQQTradingBot, setup_logging
+        setup_logging()
         bot = TQQQTradingBot(paper_trading=paper_trading)
         bot.run()
         
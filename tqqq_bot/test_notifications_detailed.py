@@ -4,7 +4,8 @@ Detailed test script for notification system
 Tests both send_notification and send_trade_alert methods
 """
 
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from notifications import NotificationHandler
 
 def test_notifications():
@@ -17,43 +18,57 @@ def test_notifications():
     
     tests = [
         ("Test 1: Basic notification", 
-         lambda: notifier.send_notification("Basic Test", "Simple notification test")),
+         lambda n: n.send_notification("Basic Test", "Simple notification test")),
         
         ("Test 2: Notification with emojis", 
-         lambda: notifier.send_notification("📊 Emoji Test", "Testing emoji support 🚀")),
+         lambda n: n.send_notification("📊 Emoji Test", "Testing emoji support 🚀")),
         
         ("Test 3: Trade alert (BUY)", 
-         lambda: notifier.send_trade_alert("BUY", "TQQQ", 1, 45.67, "ORD123")),
+         lambda n: n.send_trade_alert("BUY", "TQQQ", 1, 45.67, "ORD123")),
         
         ("Test 4: Trade alert (SELL)", 
-         lambda: notifier.send_trade_alert("SELL", "TQQQ", 1, 46.89, "ORD456")),
+         lambda n: n.send_trade_alert("SELL", "TQQQ", 1, 46.89, "ORD456")),
         
         ("Test 5: Critical notification", 
-         lambda: notifier.send_notification("Critical Alert", "This is critical!", urgency='critical')),
+         lambda n: n.send_notification("Critical Alert", "This is critical!", urgency='critical')),
         
         ("Test 6: Long message notification", 
-         lambda: notifier.send_notification("Long Message", "This is a very long message that contains a lot of text to test how the notification system handles lengthy content. It should be truncated appropriately to fit within system limits while still conveying the important information to the user.")),
+         lambda n: n.send_notification("Long Message", "This is a very long message that contains a lot of text to test how the notification system handles lengthy content. It should be truncated appropriately to fit within system limits while still conveying the important information to the user.")),
         
         ("Test 7: Special characters", 
-         lambda: notifier.send_notification("Special Chars", "Price: $123.45 | P&L: +2.5% | Order #ABC-123")),
+         lambda n: n.send_notification("Special Chars", "Price: $123.45 | P&L: +2.5% | Order #ABC-123")),
         
         ("Test 8: P&L Updates", 
-         lambda: (notifier.send_pnl_update(125.50, 2.5), 
-                  time.sleep(1),
-                  notifier.send_pnl_update(-75.25, -1.5))[0]),
+         lambda n: (n.send_pnl_update(125.50, 2.5),
+                    n.send_pnl_update(-75.25, -1.5))[0]),
         
         ("Test 9: Market status", 
-         lambda: notifier.send_market_status("OPEN")),
+         lambda n: n.send_market_status("OPEN")),
     ]
     
-    for i, (description, test_func) in enumerate(tests, 1):
-        print(f"\n{description}...")
-        try:
-            test_func()
-            print(f"  ✅ Success")
-            time.sleep(1)  # Small delay between tests
-        except Exception as e:
-            print(f"  ❌ Failed: {e}")
+    # The tests are I/O bound (console, log file, desktop IPC), so run them
+    # concurrently; the semaphore keeps at most 3 notifications in flight so
+    # the desktop notification center isn't flooded
+    in_flight = threading.Semaphore(3)
+    
+    def run_limited(test_func):
+        with in_flight:
+            return test_func(notifier)
+    
+    # Every test shares the one handler (and its open log file)
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = {executor.submit(run_limited, test_func): description
+                       for description, test_func in tests}
+            for future in as_completed(futures):
+                description = futures[future]
+                try:
+                    future.result()
+                    print(f"\n{description}...\n  ✅ Success")
+                except Exception as e:
+                    print(f"\n{description}...\n  ❌ Failed: {e}")
+    finally:
+        notifier.close()
     
     print("\n" + "=" * 60)
     print("TEST SUMMARY")
@@ -7,10 +7,19 @@ Exit: Always sell at 12:59 PM (1 minute before market close)
 import os
 import sys
 import time
+import queue
+import atexit
 import logging
-from datetime import datetime, timedelta
+import logging.handlers
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, time as dtime
+from concurrent.futures import ThreadPoolExecutor
 import pytz
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from alpaca.common.exceptions import APIError
 from alpaca.trading.client import TradingClient
 from alpaca.trading.requests import MarketOrderRequest
 from alpaca.trading.enums import OrderSide, TimeInForce
@@ -25,21 +34,68 @@ from notifications import NotificationHandler
 # Load environment variables
 load_dotenv()
 
-# Create logs directory if it doesn't exist
+# Logs are written here
 log_dir = os.path.join(os.path.dirname(__file__), 'logs')
-os.makedirs(log_dir, exist_ok=True)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
+# Queue-based logging, owned by setup_logging/stop_logging
+_log_queue_handler = None
+_log_listener = None
+
+def setup_logging():
+    """
+    Configure logging: callers only enqueue records, a background listener
+    does the file/console writes
+    
+    Called by the entry points rather than at import; safe to call twice. The
+    listener is stopped (and queued records flushed) at interpreter exit.
+    """
+    global _log_queue_handler, _log_listener
+    if _log_listener is not None:
+        return
+    os.makedirs(log_dir, exist_ok=True)
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [
         logging.FileHandler(os.path.join(log_dir, 'tqqq_trading_bot.log')),
         logging.StreamHandler()
     ]
-)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    log_queue = queue.Queue(-1)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    _log_queue_handler = logging.handlers.QueueHandler(log_queue)
+    root_logger.addHandler(_log_queue_handler)
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+    _log_listener.start()
+    atexit.register(stop_logging)
+
+def stop_logging():
+    """Detach the queue handler, flush the queued records and close the log handlers"""
+    global _log_queue_handler, _log_listener
+    if _log_listener is None:
+        return
+    logging.getLogger().removeHandler(_log_queue_handler)
+    _log_listener.stop()
+    for handler in _log_listener.handlers:
+        handler.close()
+    _log_queue_handler = _log_listener = None
+
 logger = logging.getLogger(__name__)
 
+@dataclass
+class Trade:
+    """One executed order, as reported in the daily summary"""
+    # Declared by hand rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('time', 'time_str', 'action', 'symbol', 'quantity', 'price', 'order_id')
+    
+    time: datetime
+    time_str: str
+    action: str
+    symbol: str
+    quantity: float
+    price: float
+    order_id: str
+
 class TQQQTradingBot:
     def __init__(self, paper_trading=True):
         """Initialize the TQQQ Trading Bot"""
@@ -54,8 +110,38 @@ class TQQQTradingBot:
         # Initialize API clients
         self._setup_api_clients()
         
-        # Initialize notification handler
+        # Initialize notification handler; alerts are delivered by a background
+        # worker so the trading path never waits on console/desktop/sound I/O
         self.notifier = NotificationHandler()
+        self._notif_queue = queue.Queue()
+        self._notif_thread = threading.Thread(target=self._notif_worker, name="notifier", daemon=True)
+        self._notif_thread.start()
+        
+        # Set to abort any pending wait_until_time
+        self._stop_event = threading.Event()
+        self._progress_timer = None
+        
+        # Today's PDT target datetimes keyed by (hour, minute), built in run()
+        self._targets = {}
+        
+        # (fetched_at monotonic seconds, Clock) from the last get_clock() call
+        self._clock_cache = (0.0, None)
+        
+        # Independent REST lookups at decision points run side by side
+        self._io_pool = ThreadPoolExecutor(max_workers=4)
+        
+        # Prebuilt default-size market orders keyed by (symbol, side), so the
+        # order path skips request validation for the usual 1-share trade
+        self._order_templates = {
+            (symbol, side): MarketOrderRequest(
+                symbol=symbol,
+                qty=self.quantity,
+                side=side,
+                time_in_force=TimeInForce.DAY
+            )
+            for symbol in (self.symbol, "SQQQ")
+            for side in (OrderSide.BUY, OrderSide.SELL)
+        }
         
         # Trading state
         self.market_open_price = None
@@ -64,11 +150,32 @@ class TQQQTradingBot:
         self.today_trades = []
         
         logger.info(f"TQQQ Trading Bot initialized - {'PAPER' if paper_trading else 'LIVE'} TRADING MODE")
-        self.notifier.send_notification(
+        self._notify(
             "Bot Started", 
             f"TQQQ Trading Bot initialized in {'PAPER' if paper_trading else 'LIVE'} mode"
         )
     
+    def _notify(self, title, message, **kwargs):
+        """Queue a notification for the background worker and return immediately"""
+        self._notif_queue.put((title, message, kwargs))
+    
+    def _notif_worker(self):
+        """Deliver queued notifications until the shutdown sentinel (None) arrives"""
+        while True:
+            item = self._notif_queue.get()
+            if item is None:
+                break
+            title, message, kwargs = item
+            try:
+                self.notifier.send_notification(title, message, **kwargs)
+            except Exception as e:
+                logger.error(f"Error sending notification: {e}")
+    
+    def _stop_notifier(self):
+        """Flush pending notifications and stop the worker"""
+        self._notif_queue.put(None)
+        self._notif_thread.join()
+    
     def _setup_api_clients(self):
         """Set up Alpaca API clients"""
         api_key = os.getenv('ALPACA_API_KEY')
@@ -91,10 +198,27 @@ class TQQQTradingBot:
         
         self.data_client = StockHistoricalDataClient(api_key, api_secret)
         
-        # Verify connection
+        # Give both clients a small keep-alive pool with retries on transient errors
+        for client in (self.trading_client, self.data_client):
+            session = getattr(client, '_session', None)
+            if session is not None:
+                session.mount("https://", HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=8,
+                    max_retries=Retry(total=3, backoff_factor=0.3),
+                ))
+        
+        # Verify connection (this also opens the trading API connection)
         account = self.trading_client.get_account()
         logger.info(f"Connected to Alpaca - Account Status: {account.status}")
         logger.info(f"Buying Power: ${account.buying_power}")
+        
+        # Open the market data connection now so the first quote of the day
+        # doesn't pay for the TLS handshake
+        try:
+            self.data_client.get_stock_latest_quote(StockLatestQuoteRequest(symbol_or_symbols=self.symbol))
+        except Exception as e:
+            logger.warning(f"Could not pre-warm market data connection: {e}")
     
     def get_current_price(self, symbol=None):
         """Get the current price of a symbol"""
@@ -118,85 +242,147 @@ class TQQQTradingBot:
             logger.error(f"Error getting current price: {e}")
             return None
     
+    def _get_clock(self):
+        """Return the market clock, reusing the last response for up to 2 seconds"""
+        now = time.monotonic()
+        fetched_at, clock = self._clock_cache
+        if clock is not None and now - fetched_at < 2.0:
+            return clock
+        clock = self.trading_client.get_clock()
+        self._clock_cache = (now, clock)
+        return clock
+    
     def is_market_open(self):
         """Check if the market is currently open"""
-        clock = self.trading_client.get_clock()
+        clock = self._get_clock()
         return clock.is_open
     
     def get_market_hours(self):
         """Get today's market hours"""
-        clock = self.trading_client.get_clock()
+        clock = self._get_clock()
         return clock.open, clock.close
     
     def wait_until_time(self, target_hour, target_minute):
-        """Wait until a specific time (in PDT)"""
+        """Wait until a specific time (in PDT); returns False if it passed or the bot was stopped"""
         now_pdt = datetime.now(self.pdt)
-        target_time = now_pdt.replace(hour=target_hour, minute=target_minute, second=0, microsecond=0)
+        target_time = self._targets.get((target_hour, target_minute))
+        if target_time is None:
+            target_time = self._localize_today(now_pdt.date(), target_hour, target_minute)
         
         if now_pdt > target_time:
-            logger.warning(f"Target time {target_hour}:{target_minute:02d} PDT has already passed")
+            logger.warning(f"Target time {target_time:%H:%M} PDT has already passed")
             return False
         
         wait_seconds = (target_time - now_pdt).total_seconds()
-        logger.info(f"Waiting until {target_hour}:{target_minute:02d} PDT ({wait_seconds:.0f} seconds)...")
-        
-        # Wait with periodic status updates
-        while wait_seconds > 0:
-            if wait_seconds > 60:
-                time.sleep(60)
-                wait_seconds -= 60
-                if wait_seconds % 300 == 0:  # Update every 5 minutes
-                    logger.info(f"Still waiting... {wait_seconds/60:.0f} minutes remaining")
-            else:
-                time.sleep(wait_seconds)
-                break
+        logger.info(f"Waiting until {target_time:%H:%M} PDT ({wait_seconds:.0f} seconds)...")
+        
+        # Sleep once for the whole interval; a timer logs progress every 5 minutes
+        self._schedule_wait_progress(target_time)
+        try:
+            interrupted = self._stop_event.wait(timeout=wait_seconds)
+        finally:
+            self._progress_timer.cancel()
         
-        return True
+        return not interrupted
+    
+    def _build_targets(self, clock):
+        """
+        Build today's open capture, entry and exit times keyed by their nominal
+        (hour, minute) PDT slots.
+        
+        When the clock's next open/close fall today they set the schedule
+        (open + 1 min, open + 30 min, close - 1 min), so half-days exit before
+        the early close; otherwise the fixed PDT times are used.
+        """
+        today = datetime.now(self.pdt).date()
+        targets = {
+            (hour, minute): self._localize_today(today, hour, minute)
+            for hour, minute in ((6, 31), (7, 0), (12, 59))
+        }
+        
+        if not clock.is_open:
+            next_open = clock.next_open.astimezone(self.pdt)
+            if next_open.date() == today:
+                targets[(6, 31)] = next_open + timedelta(minutes=1)
+                targets[(7, 0)] = next_open + timedelta(minutes=30)
+        next_close = clock.next_close.astimezone(self.pdt)
+        if next_close.date() == today:
+            targets[(12, 59)] = next_close - timedelta(minutes=1)
+        return targets
+    
+    def _localize_today(self, today, hour, minute):
+        """Return hour:minute on the given date as a PDT-aware datetime"""
+        return self.pdt.localize(datetime.combine(today, dtime(hour, minute)))
+    
+    def _schedule_wait_progress(self, target_time):
+        """Arm the next 5-minute progress log for wait_until_time"""
+        self._progress_timer = threading.Timer(300, self._log_waiting_progress, args=(target_time,))
+        self._progress_timer.daemon = True
+        self._progress_timer.start()
+    
+    def _log_waiting_progress(self, target_time):
+        """Log the remaining wait and re-arm the timer"""
+        remaining = (target_time - datetime.now(self.pdt)).total_seconds()
+        if remaining > 0 and not self._stop_event.is_set():
+            logger.info(f"Still waiting... {remaining/60:.0f} minutes remaining")
+            self._schedule_wait_progress(target_time)
     
-    def place_order(self, side, quantity=None, symbol=None):
-        """Place a market order"""
+    def place_order(self, side, quantity=None, symbol=None, ref_price=None):
+        """
+        Place a market order
+        
+        ref_price is the caller's latest quote, used for logging and trade
+        tracking; a fresh quote is fetched only when it is not supplied.
+        """
+        notify, log = self._notify, logger.info
         if quantity is None:
             quantity = self.quantity
         if symbol is None:
             symbol = self.symbol
         
         try:
-            # Create order request
-            order_request = MarketOrderRequest(
-                symbol=symbol,
-                qty=quantity,
-                side=side,
-                time_in_force=TimeInForce.DAY
-            )
+            # Create order request (reusing the prebuilt one for the default size)
+            order_request = self._order_templates.get((symbol, side)) if quantity == self.quantity else None
+            if order_request is None:
+                order_request = MarketOrderRequest(
+                    symbol=symbol,
+                    qty=quantity,
+                    side=side,
+                    time_in_force=TimeInForce.DAY
+                )
             
             # Submit order
             order = self.trading_client.submit_order(order_request)
             
             # Log and notify
             action = "BUY" if side == OrderSide.BUY else "SELL"
-            current_price = self.get_current_price(symbol)
+            current_price = ref_price if ref_price is not None else self.get_current_price(symbol)
+            # The order is already in, so an unknown price only affects reporting
+            price_text = f"~${current_price:.2f}" if current_price else "market price (quote unavailable)"
             
-            logger.info(f"Order placed: {action} {quantity} {symbol} at ~${current_price:.2f}")
-            self.notifier.send_notification(
+            log(f"Order placed: {action} {quantity} {symbol} at {price_text}")
+            notify(
                 f"Trade Executed: {action}",
-                f"{action} {quantity} share of {symbol} at ~${current_price:.2f}\nOrder ID: {order.id}"
+                f"{action} {quantity} share of {symbol} at {price_text}\nOrder ID: {order.id}"
             )
             
             # Track trade
-            self.today_trades.append({
-                'time': datetime.now(self.pdt),
-                'action': action,
-                'symbol': symbol,
-                'quantity': quantity,
-                'price': current_price,
-                'order_id': order.id
-            })
+            trade_time = datetime.now(self.pdt)
+            self.today_trades.append(Trade(
+                time=trade_time,
+                time_str=trade_time.strftime('%H:%M:%S PDT'),
+                action=action,
+                symbol=symbol,
+                quantity=quantity,
+                price=current_price,
+                order_id=order.id
+            ))
             
             return order
             
         except Exception as e:
             logger.error(f"Error placing order: {e}")
-            self.notifier.send_notification("Order Failed", f"Failed to place {side} order: {str(e)}")
+            notify("Order Failed", f"Failed to place {side} order: {str(e)}")
             return None
     
     def get_position(self, symbol=None):
@@ -205,10 +391,12 @@ class TQQQTradingBot:
             symbol = self.symbol
         
         try:
-            positions = self.trading_client.get_all_positions()
-            for position in positions:
-                if position.symbol == symbol:
-                    return position
+            return self.trading_client.get_open_position(symbol)
+        except APIError as e:
+            # 404 just means there is no open position in this symbol
+            if e.status_code == 404:
+                return None
+            logger.error(f"Error getting position: {e}")
             return None
         except Exception as e:
             logger.error(f"Error getting position: {e}")
@@ -216,141 +404,177 @@ class TQQQTradingBot:
     
     def execute_morning_strategy(self):
         """Execute the morning trading strategy at 7:00 AM"""
-        logger.info("=" * 50)
-        logger.info("Executing morning strategy...")
+        notify, log = self._notify, logger.info
+        log("=" * 50)
+        log("Executing morning strategy...")
         
-        # Get 7:00 AM price
-        self.seven_am_price = self.get_current_price()
+        # Get 7:00 AM price (SQQQ is quoted alongside in case the signal is SELL)
+        f_price = self._io_pool.submit(self.get_current_price)
+        f_sqqq_price = self._io_pool.submit(self.get_current_price, "SQQQ")
+        self.seven_am_price = f_price.result()
         
         if self.seven_am_price is None or self.market_open_price is None:
             logger.error("Cannot execute strategy - missing price data")
-            self.notifier.send_notification("Strategy Error", "Missing price data for strategy execution")
+            notify("Strategy Error", "Missing price data for strategy execution")
             return
         
         # Make trading decision
         price_change = self.seven_am_price - self.market_open_price
         price_change_pct = (price_change / self.market_open_price) * 100
         
-        logger.info(f"Market Open Price (6:31 AM): ${self.market_open_price:.2f}")
-        logger.info(f"Current Price (7:00 AM): ${self.seven_am_price:.2f}")
-        logger.info(f"Price Change: ${price_change:.2f} ({price_change_pct:.2f}%)")
+        log(f"Market Open Price (6:31 AM): ${self.market_open_price:.2f}")
+        log(f"Current Price (7:00 AM): ${self.seven_am_price:.2f}")
+        log(f"Price Change: ${price_change:.2f} ({price_change_pct:.2f}%)")
         
         if self.seven_am_price > self.market_open_price:
             # Price went up - BUY signal
-            logger.info("SIGNAL: BUY - Price increased since market open")
-            order = self.place_order(OrderSide.BUY)
+            log("SIGNAL: BUY - Price increased since market open")
+            order = self.place_order(OrderSide.BUY, ref_price=self.seven_am_price)
             if order:
                 self.position_opened = True
-                self.notifier.send_notification(
+                notify(
                     "BUY Signal Executed",
                     f"Bought TQQQ at ${self.seven_am_price:.2f}\n"
                     f"Price increased {price_change_pct:.2f}% since open"
                 )
         else:
             # Price went down or stayed same - Buy SQQQ (inverse ETF)
-            logger.info("SIGNAL: SELL/SHORT - Price decreased or unchanged since market open")
-            logger.info("Buying SQQQ (inverse ETF) instead of selling")
+            log("SIGNAL: SELL/SHORT - Price decreased or unchanged since market open")
+            log("Buying SQQQ (inverse ETF) instead of selling")
             
             # Buy 1 share of SQQQ
-            sqqq_price = self.get_current_price("SQQQ")
+            sqqq_price = f_sqqq_price.result()
             if sqqq_price:
-                order = self.place_order(OrderSide.BUY, quantity=1, symbol="SQQQ")
+                order = self.place_order(OrderSide.BUY, quantity=1, symbol="SQQQ", ref_price=sqqq_price)
                 if order:
-                    self.notifier.send_notification(
+                    notify(
                         "SQQQ Buy Signal Executed",
                         f"Bought 1 share of SQQQ at ${sqqq_price:.2f}\n"
                         f"TQQQ price decreased {abs(price_change_pct):.2f}% since open"
                     )
             else:
                 logger.error("Could not get SQQQ price")
-                self.notifier.send_notification(
+                notify(
                     "SQQQ Buy Failed",
                     "Could not get SQQQ price"
                 )
     
+    def _recorded_price(self, order, price):
+        """price, or the one place_order recorded for order when the caller had none"""
+        if price:
+            return price
+        return next((trade.price for trade in reversed(self.today_trades) if trade.order_id == order.id), None)
+    
+    @staticmethod
+    def _price_text(price):
+        """Format a report price, which may be unknown"""
+        return f"${price:.2f}" if price else "market price (quote unavailable)"
+    
     def close_position(self):
         """Close any open positions (TQQQ and SQQQ) at 12:59 PM"""
-        logger.info("=" * 50)
-        logger.info("Executing end-of-day position close...")
+        notify, log = self._notify, logger.info
+        log("=" * 50)
+        log("Executing end-of-day position close...")
         
         positions_closed = []
         
+        # Look up both positions, then quote only the symbols actually held
+        f_tqqq_pos = self._io_pool.submit(self.get_position, "TQQQ")
+        f_sqqq_pos = self._io_pool.submit(self.get_position, "SQQQ")
+        tqqq_position = f_tqqq_pos.result()
+        sqqq_position = f_sqqq_pos.result()
+        
+        tqqq_held = tqqq_position and float(tqqq_position.qty) > 0
+        sqqq_held = sqqq_position and float(sqqq_position.qty) > 0
+        f_tqqq_price = self._io_pool.submit(self.get_current_price, "TQQQ") if tqqq_held else None
+        f_sqqq_price = self._io_pool.submit(self.get_current_price, "SQQQ") if sqqq_held else None
+        
         # Check and close TQQQ position
-        tqqq_position = self.get_position("TQQQ")
-        if tqqq_position and float(tqqq_position.qty) > 0:
-            current_price = self.get_current_price("TQQQ")
+        if tqqq_held:
+            current_price = f_tqqq_price.result()
             qty = float(tqqq_position.qty)
             
-            logger.info(f"Closing TQQQ position: {qty} shares")
-            order = self.place_order(OrderSide.SELL, quantity=qty, symbol="TQQQ")
+            log(f"Closing TQQQ position: {qty} shares")
+            order = self.place_order(OrderSide.SELL, quantity=qty, symbol="TQQQ", ref_price=current_price)
             
             if order:
-                positions_closed.append(f"TQQQ: {qty} shares at ${current_price:.2f}")
-                # Calculate P&L if we opened position today
-                if self.position_opened and self.seven_am_price:
+                current_price = self._recorded_price(order, current_price)
+                positions_closed.append(f"TQQQ: {qty} shares at {self._price_text(current_price)}")
+                # Calculate P&L if we opened position today (and know the sell price)
+                if self.position_opened and self.seven_am_price and current_price:
                     pnl = (current_price - self.seven_am_price) * qty
                     pnl_pct = ((current_price - self.seven_am_price) / self.seven_am_price) * 100
                     positions_closed.append(f"TQQQ P&L: ${pnl:.2f} ({pnl_pct:.2f}%)")
         
         # Check and close SQQQ position
-        sqqq_position = self.get_position("SQQQ")
-        if sqqq_position and float(sqqq_position.qty) > 0:
-            current_price = self.get_current_price("SQQQ")
+        if sqqq_held:
+            current_price = f_sqqq_price.result()
             qty = float(sqqq_position.qty)
             
-            logger.info(f"Closing SQQQ position: {qty} shares")
-            order = self.place_order(OrderSide.SELL, quantity=qty, symbol="SQQQ")
+            log(f"Closing SQQQ position: {qty} shares")
+            order = self.place_order(OrderSide.SELL, quantity=qty, symbol="SQQQ", ref_price=current_price)
             
             if order:
-                positions_closed.append(f"SQQQ: {qty} shares at ${current_price:.2f}")
+                current_price = self._recorded_price(order, current_price)
+                positions_closed.append(f"SQQQ: {qty} shares at {self._price_text(current_price)}")
         
         # Send notification
         if positions_closed:
-            self.notifier.send_notification(
+            notify(
                 "Positions Closed",
                 "\n".join(positions_closed)
             )
         else:
-            logger.info("No positions to close")
-            self.notifier.send_notification("No Positions", "No positions to close at market close")
+            log("No positions to close")
+            notify("No Positions", "No positions to close at market close")
     
     def generate_daily_summary(self):
         """Generate and send daily trading summary"""
         logger.info("=" * 50)
         logger.info("DAILY TRADING SUMMARY")
         
-        summary = f"TQQQ Trading Bot - Daily Summary\n"
-        summary += f"Date: {datetime.now(self.pdt).strftime('%Y-%m-%d')}\n"
-        summary += f"{'='*40}\n"
+        # Fetch account info while the summary is built
+        f_account = self._io_pool.submit(self.trading_client.get_account)
+        
+        now_pdt = datetime.now(self.pdt)
+        parts = [
+            "TQQQ Trading Bot - Daily Summary\n",
+            f"Date: {now_pdt.strftime('%Y-%m-%d')}\n",
+            f"{'='*40}\n",
+        ]
         
         if self.market_open_price and self.seven_am_price:
-            summary += f"Market Open Price: ${self.market_open_price:.2f}\n"
-            summary += f"7:00 AM Price: ${self.seven_am_price:.2f}\n"
-            summary += f"Signal: {'BUY' if self.seven_am_price > self.market_open_price else 'SELL'}\n"
+            parts.append(f"Market Open Price: ${self.market_open_price:.2f}\n")
+            parts.append(f"7:00 AM Price: ${self.seven_am_price:.2f}\n")
+            parts.append(f"Signal: {'BUY' if self.seven_am_price > self.market_open_price else 'SELL'}\n")
         
-        summary += f"\nTrades Executed: {len(self.today_trades)}\n"
+        parts.append(f"\nTrades Executed: {len(self.today_trades)}\n")
         
-        total_pnl = 0
         for i, trade in enumerate(self.today_trades, 1):
-            summary += f"\nTrade {i}:\n"
-            summary += f"  Time: {trade['time'].strftime('%H:%M:%S PDT')}\n"
-            summary += f"  Action: {trade['action']}\n"
-            summary += f"  Symbol: {trade['symbol']}\n"
-            summary += f"  Quantity: {trade['quantity']}\n"
-            summary += f"  Price: ${trade['price']:.2f}\n"
+            parts.append(
+                f"\nTrade {i}:\n"
+                f"  Time: {trade.time_str}\n"
+                f"  Action: {trade.action}\n"
+                f"  Symbol: {trade.symbol}\n"
+                f"  Quantity: {trade.quantity}\n"
+                f"  Price: {f'${trade.price:.2f}' if trade.price else 'N/A'}\n"
+            )
         
         # Get account info
-        account = self.trading_client.get_account()
-        summary += f"\nAccount Status:\n"
-        summary += f"  Buying Power: ${account.buying_power}\n"
-        summary += f"  Portfolio Value: ${account.portfolio_value}\n"
+        account = f_account.result()
+        parts.append(
+            f"\nAccount Status:\n"
+            f"  Buying Power: ${account.buying_power}\n"
+            f"  Portfolio Value: ${account.portfolio_value}\n"
+        )
+        summary = "".join(parts)
         
         logger.info(summary)
-        self.notifier.send_notification("Daily Summary", summary)
+        self._notify("Daily Summary", summary)
         
         # Save to file in logs directory
-        log_dir = os.path.join(os.path.dirname(__file__), 'logs')
-        summary_file = os.path.join(log_dir, f"trade_summary_{datetime.now(self.pdt).strftime('%Y%m%d')}.txt")
+        os.makedirs(log_dir, exist_ok=True)
+        summary_file = os.path.join(log_dir, f"trade_summary_{now_pdt.strftime('%Y%m%d')}.txt")
         with open(summary_file, 'w') as f:
             f.write(summary)
     
@@ -359,10 +583,14 @@ class TQQQTradingBot:
         try:
             logger.info("Starting TQQQ Trading Bot...")
             
+            # One clock query drives both the open check and today's schedule
+            clock = self._get_clock()
+            self._targets = self._build_targets(clock)
+            
             # Check if market is open
-            if not self.is_market_open():
+            if not clock.is_open:
                 logger.warning("Market is closed. Waiting for market open...")
-                self.notifier.send_notification("Market Closed", "Bot is waiting for market to open")
+                self._notify("Market Closed", "Bot is waiting for market to open")
                 
                 # You might want to wait until market opens or exit
                 # For now, we'll proceed assuming market will open
@@ -374,7 +602,7 @@ class TQQQTradingBot:
                 self.market_open_price = self.get_current_price()
                 if self.market_open_price:
                     logger.info(f"Market open price captured: ${self.market_open_price:.2f}")
-                    self.notifier.send_notification(
+                    self._notify(
                         "Market Open",
                         f"TQQQ opened at ${self.market_open_price:.2f}"
                     )
@@ -394,12 +622,17 @@ class TQQQTradingBot:
             
         except KeyboardInterrupt:
             logger.info("Bot interrupted by user")
-            self.notifier.send_notification("Bot Stopped", "Trading bot stopped by user")
+            self._stop_event.set()
+            self._notify("Bot Stopped", "Trading bot stopped by user")
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
-            self.notifier.send_notification("Bot Error", f"Unexpected error: {str(e)}")
+            self._notify("Bot Error", f"Unexpected error: {str(e)}")
             raise
+        finally:
+            self._io_pool.shutdown(wait=False)
+            self._stop_notifier()
 
 if __name__ == "__main__":
+    setup_logging()
     bot = TQQQTradingBot(paper_trading=True)
     bot.run()
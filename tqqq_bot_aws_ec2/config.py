@@ -3,6 +3,9 @@ Configuration file for TQQQ/SQQQ Trading Bot
 Modify these settings to customize the bot's behavior
 """
 
+import functools
+from types import MappingProxyType
+
 # Trading Configuration
 TRADING_CONFIG = {
     'tqqq_symbol': 'TQQQ',               # Long ETF symbol
@@ -102,74 +105,87 @@ SYSTEMD_CONFIG = {
     'working_directory': '/home/ubuntu/tqqq_bot_aws_ec2',  # Working directory
 }
 
-def get_config():
-    """Return the complete configuration dictionary"""
-    return {
-        'trading': TRADING_CONFIG,
-        'aws': AWS_CONFIG,
-        'notifications': NOTIFICATION_CONFIG,
-        'email': EMAIL_CONFIG,
-        'logging': LOGGING_CONFIG,
-        'schedule': SCHEDULE_CONFIG,
-        'advanced': ADVANCED_CONFIG,
-        'performance': PERFORMANCE_CONFIG,
-        'systemd': SYSTEMD_CONFIG,
-    }
+# Required (hour, minute) PDT schedule for this strategy
+_EXPECTED = {
+    'open_capture_time': (6, 30),
+    'entry_time': (7, 0),
+    'exit_time': (12, 59),
+}
 
-def validate_config():
-    """Validate configuration settings"""
-    errors = []
-    warnings = []
-    
-    # Validate trading times - CRITICAL for this strategy
-    if TRADING_CONFIG['open_capture_time'] != {'hour': 6, 'minute': 30}:
-        errors.append("Open capture time MUST be 6:30 AM PDT for this strategy")
-    
-    if TRADING_CONFIG['entry_time'] != {'hour': 7, 'minute': 0}:
-        errors.append("Entry time MUST be 7:00 AM PDT for this strategy")
-    
-    if TRADING_CONFIG['exit_time'] != {'hour': 12, 'minute': 59}:
-        errors.append("Exit time MUST be 12:59 PM PDT for this strategy")
-    
-    # Validate quantities
-    if TRADING_CONFIG['quantity'] <= 0:
-        errors.append("Trade quantity must be positive")
-    
-    if TRADING_CONFIG['quantity'] != 1:
-        warnings.append(f"Strategy designed for 1 share, but configured for {TRADING_CONFIG['quantity']}")
-    
-    if TRADING_CONFIG['max_position_size'] < TRADING_CONFIG['quantity']:
-        errors.append("Max position size must be >= trade quantity")
+def _to_tuple(t):
+    """Convert a {'hour': h, 'minute': m} time setting to (h, m)"""
+    return (t['hour'], t['minute'])
+
+@functools.lru_cache(maxsize=1)
+def get_config():
+    """
+    Return the complete configuration dictionary
     
-    # Validate AWS settings if CloudWatch is enabled
-    if AWS_CONFIG['enable_cloudwatch']:
-        if not AWS_CONFIG['region']:
-            errors.append("AWS region required when CloudWatch is enabled")
+    Built once and cached as a read-only mapping of read-only sections; call
+    get_config.cache_clear() after replacing a module-level section.
+    """
+    return MappingProxyType({
+        'trading': MappingProxyType(TRADING_CONFIG),
+        'aws': MappingProxyType(AWS_CONFIG),
+        'notifications': MappingProxyType(NOTIFICATION_CONFIG),
+        'email': MappingProxyType(EMAIL_CONFIG),
+        'logging': MappingProxyType(LOGGING_CONFIG),
+        'schedule': MappingProxyType(SCHEDULE_CONFIG),
+        'advanced': MappingProxyType(ADVANCED_CONFIG),
+        'performance': MappingProxyType(PERFORMANCE_CONFIG),
+        'systemd': MappingProxyType(SYSTEMD_CONFIG),
+    })
+
+# (predicate, level, message) checks run by validate_config, in report order.
+# Predicates read the module-level settings at call time.
+CHECKS = [
+    # Trading times - CRITICAL for this strategy
+    (lambda: _to_tuple(TRADING_CONFIG['open_capture_time']) != _EXPECTED['open_capture_time'],
+     'error', "Open capture time MUST be 6:30 AM PDT for this strategy"),
+    (lambda: _to_tuple(TRADING_CONFIG['entry_time']) != _EXPECTED['entry_time'],
+     'error', "Entry time MUST be 7:00 AM PDT for this strategy"),
+    (lambda: _to_tuple(TRADING_CONFIG['exit_time']) != _EXPECTED['exit_time'],
+     'error', "Exit time MUST be 12:59 PM PDT for this strategy"),
     
-    if AWS_CONFIG['enable_sns']:
-        if not AWS_CONFIG['sns_topic_arn']:
-            errors.append("SNS topic ARN required when SNS is enabled")
+    # Quantities
+    (lambda: TRADING_CONFIG['quantity'] <= 0,
+     'error', "Trade quantity must be positive"),
+    (lambda: TRADING_CONFIG['quantity'] != 1,
+     'warning', lambda: f"Strategy designed for 1 share, but configured for {TRADING_CONFIG['quantity']}"),
+    (lambda: TRADING_CONFIG['max_position_size'] < TRADING_CONFIG['quantity'],
+     'error', "Max position size must be >= trade quantity"),
     
-    # Validate email settings if enabled
-    if NOTIFICATION_CONFIG['enable_email']:
-        if not EMAIL_CONFIG['sender_email'] or not EMAIL_CONFIG['sender_password']:
-            errors.append("Email credentials required when email notifications are enabled")
+    # AWS settings
+    (lambda: AWS_CONFIG['enable_cloudwatch'] and not AWS_CONFIG['region'],
+     'error', "AWS region required when CloudWatch is enabled"),
+    (lambda: AWS_CONFIG['enable_sns'] and not AWS_CONFIG['sns_topic_arn'],
+     'error', "SNS topic ARN required when SNS is enabled"),
     
-    # Validate systemd settings
-    if SYSTEMD_CONFIG['restart_policy'] not in ['always', 'on-failure', 'no']:
-        errors.append("Invalid restart policy. Must be 'always', 'on-failure', or 'no'")
+    # Email settings
+    (lambda: NOTIFICATION_CONFIG['enable_email'] and (not EMAIL_CONFIG['sender_email'] or not EMAIL_CONFIG['sender_password']),
+     'error', "Email credentials required when email notifications are enabled"),
     
-    # Check for EC2-specific settings
-    if not NOTIFICATION_CONFIG['enable_desktop']:
-        warnings.append("Desktop notifications disabled - appropriate for EC2 headless environment")
+    # Systemd settings
+    (lambda: SYSTEMD_CONFIG['restart_policy'] not in ('always', 'on-failure', 'no'),
+     'error', "Invalid restart policy. Must be 'always', 'on-failure', or 'no'"),
     
+    # EC2-specific settings
+    (lambda: not NOTIFICATION_CONFIG['enable_desktop'],
+     'warning', "Desktop notifications disabled - appropriate for EC2 headless environment"),
+]
+
+def validate_config():
+    """Validate configuration settings"""
+    errors = []
+    warnings = []
+    for predicate, level, message in CHECKS:
+        if predicate():
+            # Messages that embed a setting are built only when the check fails
+            (errors if level == 'error' else warnings).append(message() if callable(message) else message)
     return errors, warnings
 
 def display_config():
     """Display current configuration in readable format"""
-    import json
-    config = get_config()
-    
     print("\n" + "=" * 60)
     print("TQQQ/SQQQ TRADING BOT CONFIGURATION")
     print("=" * 60)
@@ -4,9 +4,23 @@ Provides desktop notifications, console output, and logging
 """
 
 import os
+import re
+import sys
+import time
+import queue
+import atexit
 import logging
+import logging.handlers
+import threading
 from datetime import datetime
-import pytz
+
+# Pacific time for notification timestamps; stdlib zoneinfo where available
+try:
+    from zoneinfo import ZoneInfo
+    _PDT = ZoneInfo('America/Los_Angeles')
+except ImportError:  # Python 3.8
+    import pytz
+    _PDT = pytz.timezone('America/Los_Angeles')
 
 # Try to import plyer for desktop notifications
 try:
@@ -16,6 +30,11 @@ except ImportError:
     PLYER_AVAILABLE = False
     print("Warning: plyer not installed. Desktop notifications will be disabled.")
 
+# Headless Linux (e.g. EC2) has no desktop session to show popups on
+if PLYER_AVAILABLE and sys.platform.startswith('linux') \
+        and 'DISPLAY' not in os.environ and 'WAYLAND_DISPLAY' not in os.environ:
+    PLYER_AVAILABLE = False
+
 # Try to import colorlog for colored console output
 try:
     import colorlog
@@ -23,27 +42,100 @@ try:
 except ImportError:
     COLORLOG_AVAILABLE = False
 
+# Notification log location, fixed for the life of the process (the dated
+# file is the day the bot started, as before)
+_LOG_DIR = os.path.join(os.path.dirname(__file__), 'logs')
+_LOG_FILENAME = os.path.join(_LOG_DIR, f'notifications_{datetime.now().strftime("%Y%m%d")}.log')
+
+# Console separators
+_BORDER = "=" * 60
+_DASHES = "-" * 60
+_BANGS = "!" * 60
+
+# Title keyword -> emoji, checked in order (the first match wins)
+_EMOJI_PAIRS = (
+    ('buy', '📈'),
+    ('sell', '📉'),
+    ('error', '❌'),
+    ('warning', '⚠️'),
+    ('started', '🚀'),
+    ('stopped', '🛑'),
+    ('shutdown', '🛑'),
+    ('completed', '✅'),
+    ('summary', '📊'),
+    ('open', '🔔'),
+    ('closed', '🔕'),
+    ('position', '💼'),
+    ('trade', '💹'),
+    ('signal', '📡'),
+    ('tqqq', '📈'),
+    ('sqqq', '📉'),
+)
+_EMOJI_LOOKUP = dict(_EMOJI_PAIRS)
+_EMOJI_RANK = {keyword: rank for rank, (keyword, _) in enumerate(_EMOJI_PAIRS)}
+# One scan finds every keyword occurrence (the lookahead lets matches overlap)
+_EMOJI_RE = re.compile('(?=(%s))' % '|'.join(map(re.escape, _EMOJI_LOOKUP)))
+
 class NotificationHandler:
+    # Buffer in front of the notifications log file, shared by all instances
+    _log_buffer = None
+    # Set once the process-wide notification log handlers are attached
+    _logging_configured = False
+    
     def __init__(self):
         """Initialize the notification handler"""
-        self.pdt = pytz.timezone('America/Los_Angeles')
-        
-        # Set up logging
-        log_dir = os.path.join(os.path.dirname(__file__), 'logs')
-        os.makedirs(log_dir, exist_ok=True)
+        self.pdt = _PDT
         
-        # Create a separate logger for notifications
+        # Separate logger for notifications; its file/console handlers are
+        # attached on the first notification (see _configure_logging_once)
         self.logger = logging.getLogger('notifications')
-        self.logger.setLevel(logging.INFO)
+        
+        # Desktop popups can spawn a helper process, so a background thread
+        # delivers them; when it falls behind, new popups are dropped
+        self._desktop_q = None
+        if PLYER_AVAILABLE:
+            self._desktop_q = queue.Queue(maxsize=128)
+            threading.Thread(target=self._desktop_worker, name="desktop-notify", daemon=True).start()
+    
+    def _desktop_worker(self):
+        """Deliver queued desktop notifications"""
+        while True:
+            title, message = self._desktop_q.get()
+            self._desktop_notification(title, message)
+    
+    @classmethod
+    def _configure_logging_once(cls):
+        """
+        Attach the notification log file and console handlers
+        
+        The 'notifications' logger is a process-wide singleton, so this runs the
+        first time any handler sends a notification; later calls and instances
+        reuse the same handlers instead of duplicating every record.
+        """
+        if cls._logging_configured:
+            return
+        cls._logging_configured = True
+        
+        logger = logging.getLogger('notifications')
+        logger.setLevel(logging.INFO)
+        # Records are written by the handlers below; don't repeat them through root
+        logger.propagate = False
+        if logger.handlers:
+            return
         
         # File handler for notifications
-        fh = logging.FileHandler(
-            os.path.join(log_dir, f'notifications_{datetime.now().strftime("%Y%m%d")}.log')
-        )
+        os.makedirs(_LOG_DIR, exist_ok=True)
+        fh = logging.FileHandler(_LOG_FILENAME)
         fh.setLevel(logging.INFO)
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         fh.setFormatter(formatter)
-        self.logger.addHandler(fh)
+        # Batch INFO records into one write per 64; errors flush immediately
+        mh = logging.handlers.MemoryHandler(
+            capacity=64, flushLevel=logging.ERROR, target=fh, flushOnClose=True
+        )
+        logger.addHandler(mh)
+        atexit.register(mh.flush)
+        cls._log_buffer = mh
         
         # Console handler with colors if available
         if COLORLOG_AVAILABLE:
@@ -60,11 +152,11 @@ class NotificationHandler:
                     }
                 )
             )
-            self.logger.addHandler(console_handler)
+            logger.addHandler(console_handler)
         else:
             console_handler = logging.StreamHandler()
             console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
+            logger.addHandler(console_handler)
     
     def send_notification(self, title, message, urgency='normal'):
         """
@@ -75,42 +167,42 @@ class NotificationHandler:
             message: Notification message
             urgency: 'low', 'normal', or 'critical'
         """
-        timestamp = datetime.now(self.pdt).strftime('%H:%M:%S PDT')
+        self._configure_logging_once()
+        
+        timestamp = datetime.now(_PDT).strftime('%H:%M:%S PDT')
         full_message = f"[{timestamp}] {message}"
         
         # Console output with formatting
         self._console_notification(title, full_message, urgency)
         
-        # Desktop notification
-        if PLYER_AVAILABLE:
-            self._desktop_notification(title, message)
+        # Desktop notification (non-blocking)
+        if self._desktop_q is not None:
+            try:
+                self._desktop_q.put_nowait((title, message))
+            except queue.Full:
+                pass
         
-        # Log the notification
+        # Log the notification (critical ones are on disk right away)
         self.logger.info(f"{title}: {message}")
+        if urgency == 'critical' and self._log_buffer is not None:
+            self._log_buffer.flush()
     
     def _console_notification(self, title, message, urgency):
         """Display formatted console notification"""
         # Determine emoji based on title content
         emoji = self._get_emoji(title)
         
-        # Create formatted output
-        border = "=" * 60
-        
+        # Create formatted output, assembled in memory and written at once
         if urgency == 'critical':
-            print("\n" + "!" * 60)
-            print(f"🚨 CRITICAL: {title}")
-            print("!" * 60)
+            parts = ["\n", _BANGS, "\n", f"🚨 CRITICAL: {title}\n", _BANGS, "\n"]
         else:
-            print("\n" + border)
-            print(f"{emoji} {title}")
-            print("-" * 60)
+            parts = ["\n", _BORDER, "\n", f"{emoji} {title}\n", _DASHES, "\n"]
         
-        # Print message lines
-        for line in message.split('\n'):
-            if line.strip():
-                print(f"  {line}")
+        # Message lines
+        parts.extend(f"  {line}\n" for line in message.splitlines() if line.strip())
         
-        print(border + "\n")
+        parts.append(_BORDER + "\n\n")
+        sys.stdout.write("".join(parts))
     
     def _desktop_notification(self, title, message):
         """Send desktop notification using plyer"""
@@ -130,32 +222,11 @@ class NotificationHandler:
     
     def _get_emoji(self, title):
         """Get appropriate emoji based on notification title"""
-        title_lower = title.lower()
-        
-        emoji_map = {
-            'buy': '📈',
-            'sell': '📉',
-            'error': '❌',
-            'warning': '⚠️',
-            'started': '🚀',
-            'stopped': '🛑',
-            'shutdown': '🛑',
-            'completed': '✅',
-            'summary': '📊',
-            'open': '🔔',
-            'closed': '🔕',
-            'position': '💼',
-            'trade': '💹',
-            'signal': '📡',
-            'tqqq': '📈',
-            'sqqq': '📉',
-        }
-        
-        for keyword, emoji in emoji_map.items():
-            if keyword in title_lower:
-                return emoji
-        
-        return '📢'  # Default emoji
+        found = _EMOJI_RE.findall(title.lower())
+        if not found:
+            return '📢'  # Default emoji
+        # Earliest table entry wins, as with the keyword-by-keyword scan
+        return _EMOJI_LOOKUP[min(found, key=_EMOJI_RANK.__getitem__)]
     
     def send_trade_alert(self, action, symbol, quantity, price, order_id=None):
         """Send a special formatted trade alert"""
@@ -177,29 +248,36 @@ class NotificationHandler:
     
     def send_pnl_report(self, symbol, buy_price, sell_price, quantity):
         """Send P&L report notification"""
-        pnl = (sell_price - buy_price) * quantity
-        pnl_pct = ((sell_price - buy_price) / buy_price) * 100
+        delta = sell_price - buy_price
+        pnl = delta * quantity
+        pnl_pct = delta / buy_price * 100
         
         title = "P&L Report"
         
-        if pnl >= 0:
-            emoji = "💰"
-            status = "PROFIT"
-        else:
-            emoji = "📉"
-            status = "LOSS"
+        emoji, status = ("💰", "PROFIT") if pnl >= 0 else ("📉", "LOSS")
         
-        message = f"{emoji} {status}: ${abs(pnl):.2f} ({pnl_pct:+.2f}%)\n"
-        message += f"Symbol: {symbol}\n"
-        message += f"Buy: ${buy_price:.2f} | Sell: ${sell_price:.2f}"
+        message = (
+            f"{emoji} {status}: ${abs(pnl):.2f} ({pnl_pct:+.2f}%)\n"
+            f"Symbol: {symbol}\n"
+            f"Buy: ${buy_price:.2f} | Sell: ${sell_price:.2f}"
+        )
         
         self.send_notification(title, message)
     
-    def test_notifications(self):
-        """Test all notification channels"""
-        print("\n" + "=" * 60)
+    def test_notifications(self, interactive=None):
+        """
+        Test all notification channels
+        
+        Args:
+            interactive: pause briefly between notifications so each can be
+                seen; defaults to whether stdout is a terminal
+        """
+        if interactive is None:
+            interactive = sys.stdout.isatty()
+        
+        print("\n" + _BORDER)
         print("TESTING NOTIFICATION SYSTEM")
-        print("=" * 60)
+        print(_BORDER)
         
         # Test different notification types
         test_cases = [
@@ -213,8 +291,8 @@ class NotificationHandler:
         for title, message, urgency in test_cases:
             print(f"\nTesting: {title}")
             self.send_notification(title, message, urgency)
-            import time
-            time.sleep(1)  # Small delay between notifications
+            if interactive:
+                time.sleep(0.1)  # Small delay between notifications
         
         # Test trade alert
         print("\nTesting trade alert...")
@@ -224,9 +302,9 @@ class NotificationHandler:
         print("\nTesting P&L report...")
         self.send_pnl_report("TQQQ", 45.00, 46.50, 1)
         
-        print("\n" + "=" * 60)
+        print("\n" + _BORDER)
         print("NOTIFICATION TEST COMPLETE")
-        print("=" * 60)
+        print(_BORDER)
         
         # Check what's available
         print("\nNotification Channels Available:")
@@ -236,7 +314,20 @@ class NotificationHandler:
         print(f"  ✓ Log Files: Yes (check logs/ directory)")
         print()
 
+# Process-wide handler shared by the launcher and the bot
+_INSTANCE = None
+_INSTANCE_LOCK = threading.Lock()
+
+def get_notifier():
+    """Return the shared NotificationHandler, creating it on first use"""
+    global _INSTANCE
+    if _INSTANCE is None:
+        with _INSTANCE_LOCK:
+            if _INSTANCE is None:
+                _INSTANCE = NotificationHandler()
+    return _INSTANCE
+
 if __name__ == "__main__":
     # Test the notification system
-    handler = NotificationHandler()
+    handler = get_notifier()
     handler.test_notifications()
@@ -7,19 +7,19 @@ Provides validation, testing, and safe execution
 import os
 import sys
 import argparse
+import importlib.util
 import logging
 from datetime import datetime
-import pytz
-from dotenv import load_dotenv
+
+# Script directory and its parent (where .env may live)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_PARENT = os.path.dirname(_HERE)
 
 # Add current directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _HERE)
 
 from config import get_config, validate_config, display_config
-from notifications import NotificationHandler
-
-# Load environment variables
-load_dotenv()
+from notifications import get_notifier
 
 # Set up logging
 logging.basicConfig(
@@ -28,17 +28,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Banner separators
+_BORDER = "=" * 60
+_BANGS = "!" * 60
+
 def check_environment():
     """Check if environment is properly configured"""
     errors = []
     warnings = []
     
-    # Check for .env file
-    env_file = os.path.join(os.path.dirname(__file__), '.env')
-    if not os.path.exists(env_file):
-        env_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
-        if not os.path.exists(env_file):
-            errors.append("No .env file found. Please create one with your Alpaca API credentials.")
+    # Load environment variables (only the validate/run paths need them)
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    # Check for .env file (stops at the first location that exists)
+    env_file = next(
+        (path for path in (os.path.join(_HERE, '.env'), os.path.join(_PARENT, '.env'))
+         if os.path.exists(path)),
+        None
+    )
+    if env_file is None:
+        errors.append("No .env file found. Please create one with your Alpaca API credentials.")
     
     # Check for API credentials
     api_key = os.getenv('ALPACA_API_KEY')
@@ -54,22 +64,25 @@ def check_environment():
         errors.append(f"Python 3.8+ required. Current version: {sys.version}")
     
     # Check for required packages
-    required_packages = ['alpaca', 'pandas', 'pytz', 'dotenv']
+    required_packages = ['alpaca', 'pandas', 'dotenv']
+    # pytz is only the timezone fallback where stdlib zoneinfo is missing (Python 3.8)
+    if importlib.util.find_spec('zoneinfo') is None:
+        required_packages.append('pytz')
     missing_packages = []
     
+    # find_spec only locates each package; it doesn't execute its import-time code
     for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
+        if importlib.util.find_spec(package) is None:
             missing_packages.append(package)
     
     if missing_packages:
         errors.append(f"Missing required packages: {', '.join(missing_packages)}")
         errors.append("Run: pip install -r requirements.txt")
     
-    # Check timezone
+    # Check timezone (stdlib zoneinfo; ZoneInfoNotFoundError means no tz database)
     try:
-        pdt = pytz.timezone('America/Los_Angeles')
+        from zoneinfo import ZoneInfo
+        pdt = ZoneInfo('America/Los_Angeles')
         current_time = datetime.now(pdt)
         logger.info(f"Current PDT time: {current_time.strftime('%Y-%m-%d %H:%M:%S PDT')}")
     except Exception as e:
@@ -79,11 +92,11 @@ def check_environment():
 
 def test_notifications():
     """Test the notification system"""
-    print("\n" + "=" * 60)
+    print("\n" + _BORDER)
     print("TESTING NOTIFICATION SYSTEM")
-    print("=" * 60)
+    print(_BORDER)
     
-    handler = NotificationHandler()
+    handler = get_notifier()
     handler.test_notifications()
     
     print("\n✅ Notification test complete!")
@@ -91,9 +104,9 @@ def test_notifications():
 
 def validate_only():
     """Validate configuration without running the bot"""
-    print("\n" + "=" * 60)
+    print("\n" + _BORDER)
     print("VALIDATING CONFIGURATION")
-    print("=" * 60)
+    print(_BORDER)
     
     # Check environment
     env_errors, env_warnings = check_environment()
@@ -133,13 +146,14 @@ def run_bot(paper_trading=True, force=False):
             print("\n⚠️  Running with validation errors (forced)...")
     
     # Import and run the bot
-    from tqqq_sqqq_bot import TQQQSQQQTradingBot
+    from tqqq_sqqq_bot import TQQQSQQQTradingBot, setup_logging
+    setup_logging()
     
     # Safety check for live trading
     if not paper_trading:
-        print("\n" + "!" * 60)
+        print("\n" + _BANGS)
         print("⚠️  WARNING: LIVE TRADING MODE")
-        print("!" * 60)
+        print(_BANGS)
         print("\nYou are about to run the bot in LIVE TRADING mode.")
         print("This will use REAL MONEY and execute REAL TRADES.")
         print("\nAre you absolutely sure you want to continue?")
@@ -158,8 +172,7 @@ def run_bot(paper_trading=True, force=False):
         print("\n\n✅ Bot stopped by user")
         return True
     except Exception as e:
-        print(f"\n❌ Error running bot: {e}")
-        logger.error(f"Bot error: {e}", exc_info=True)
+        logger.exception("Bot error: %s", e)
         return False
 
 def main():
@@ -175,7 +188,7 @@ Examples:
   python run_bot.py --test-notifications  # Test notification system
   
 Trading Schedule (PDT):
-  6:30 AM - Capture open price
+  6:30 AM - Market open (open price read from the 7:00 AM snapshot)
   7:00 AM - Make buy decision (TQQQ if price up, SQQQ if price down/same)
   12:59 PM - Close position
         """
@@ -220,15 +233,6 @@ Trading Schedule (PDT):
     
     args = parser.parse_args()
     
-    # Display header
-    print("\n" + "=" * 60)
-    print("🤖 TQQQ/SQQQ TRADING BOT FOR AWS EC2")
-    print("=" * 60)
-    print(f"Version: 1.0.0")
-    print(f"Strategy: Buy TQQQ/SQQQ based on 7AM vs 6:30AM price")
-    print(f"Exit: Always at 12:59 PM PDT")
-    print("=" * 60)
-    
     # Handle different modes
     if args.config:
         display_config()
@@ -240,6 +244,17 @@ Trading Schedule (PDT):
     if args.validate_only:
         return 0 if validate_only() else 1
     
+    # Display header (only when actually starting the bot)
+    print(
+        f"\n{_BORDER}\n"
+        "🤖 TQQQ/SQQQ TRADING BOT FOR AWS EC2\n"
+        f"{_BORDER}\n"
+        "Version: 1.0.0\n"
+        "Strategy: Buy TQQQ/SQQQ based on 7AM vs 6:30AM price\n"
+        "Exit: Always at 12:59 PM PDT\n"
+        f"{_BORDER}"
+    )
+    
     # Determine trading mode
     paper_trading = not args.live
     
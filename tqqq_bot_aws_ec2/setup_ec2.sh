@@ -187,9 +187,10 @@ print_status "Reloading systemd..."
 sudo systemctl daemon-reload
 
 # Create log rotation configuration
+# (logs/tqqq_sqqq_bot.log is left out: the bot rotates it itself at midnight)
 print_status "Setting up log rotation..."
 sudo tee /etc/logrotate.d/tqqq-bot > /dev/null << EOL
-$BOT_DIR/logs/*.log {
+$BOT_DIR/logs/cron.log $BOT_DIR/logs/notifications_*.log {
     daily
     rotate 30
     compress
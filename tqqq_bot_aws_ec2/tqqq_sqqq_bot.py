@@ -5,43 +5,96 @@ Exit: Always sell at 12:59 PM PDT
 All times are in PDT (Pacific Daylight Time)
 """
 
+import io
 import os
 import sys
 import time
 import logging
+import logging.handlers
+import threading
 from datetime import datetime, timedelta
-import pytz
-from dotenv import load_dotenv
-from alpaca.trading.client import TradingClient
-from alpaca.trading.requests import MarketOrderRequest
-from alpaca.trading.enums import OrderSide, TimeInForce
-from alpaca.data.historical import StockHistoricalDataClient
-from alpaca.data.requests import StockLatestQuoteRequest
+from concurrent.futures import ThreadPoolExecutor
 import signal
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import notification module
-from notifications import NotificationHandler
+from notifications import get_notifier
 
-# Load environment variables
-load_dotenv()
+# Bot timezones; stdlib zoneinfo reads the system tz database where available.
+# alpaca and dotenv are imported where they're first used, so importing this
+# module stays cheap
+try:
+    from zoneinfo import ZoneInfo
+    _PDT = ZoneInfo('America/Los_Angeles')
+    _ET = ZoneInfo('America/New_York')
+except ImportError:  # Python 3.8
+    import pytz
+    _PDT = pytz.timezone('America/Los_Angeles')
+    _ET = pytz.timezone('America/New_York')
 
-# Create logs directory if it doesn't exist
+# Logs, trade summaries and trade data are written here
 log_dir = os.path.join(os.path.dirname(__file__), 'logs')
-os.makedirs(log_dir, exist_ok=True)
 
-# Configure logging with more detailed format for EC2
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-    handlers=[
-        logging.FileHandler(os.path.join(log_dir, f'tqqq_sqqq_bot_{datetime.now().strftime("%Y%m%d")}.log')),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+def setup_logging():
+    """
+    Configure logging with more detailed format for EC2
+    
+    Called by the entry points rather than at import. The log file rolls over
+    at local midnight and the last 30 days are kept.
+    """
+    os.makedirs(log_dir, exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
+        handlers=[
+            logging.handlers.TimedRotatingFileHandler(
+                os.path.join(log_dir, 'tqqq_sqqq_bot.log'),
+                when='midnight', backupCount=30, utc=False
+            ),
+            logging.StreamHandler()
+        ],
+        force=True
+    )
+
+def _dumps(obj):
+    """Serialize obj to compact JSON bytes (orjson when installed)"""
+    return orjson.dumps(obj) if ORJSON_AVAILABLE else json.dumps(obj).encode('utf-8')
+
+def _loads(data):
+    """Parse JSON bytes (orjson when installed)"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+# Streamed quotes older than this (seconds) are not trusted; fall back to REST
+STREAM_QUOTE_MAX_AGE = 10
+# How long get_current_price waits for the stream's first quote
+STREAM_FIRST_QUOTE_WAIT = 5
+
 class TQQQSQQQTradingBot:
+    # Notification and report templates, filled in with str.format
+    _TMPL_BUY_TQQQ = "Bought 1 share of TQQQ at ${price:.2f}\nPrice increased {pct:.2f}% since 6:30 AM open"
+    _TMPL_BUY_SQQQ = "Bought 1 share of SQQQ at ${price:.2f}\nTQQQ price decreased {pct:.2f}% since 6:30 AM open"
+    _TMPL_BUY_SQQQ_UNPRICED = "Bought 1 share of SQQQ\nTQQQ price decreased {pct:.2f}% since 6:30 AM open"
+    _TMPL_SOLD = "{symbol}: Sold {qty} shares at ${price:.2f}"
+    _TMPL_SOLD_PNL = _TMPL_SOLD + "\nP&L: ${pnl:+.2f} ({pnl_pct:+.2f}%)"
+    _TMPL_SOLD_UNPRICED = "{symbol}: Sold {qty} shares at market price (quote unavailable)"
+    _TMPL_SUMMARY_TRADE = (
+        "\n"
+        "Trade {n}:\n"
+        "  Time: {time:%H:%M:%S PDT}\n"
+        "  Action: {action}\n"
+        "  Symbol: {symbol}\n"
+        "  Quantity: {quantity}\n"
+    )
+    _TMPL_SUMMARY_PRICE = "  Price: ${price:.2f}\n"
+    
     def __init__(self, paper_trading=True):
         """Initialize the TQQQ/SQQQ Trading Bot for AWS EC2"""
         self.tqqq_symbol = "TQQQ"
@@ -50,14 +103,33 @@ class TQQQSQQQTradingBot:
         self.paper_trading = paper_trading
         
         # Set up timezone - ALWAYS use PDT for this bot
-        self.pdt = pytz.timezone('America/Los_Angeles')
-        self.et = pytz.timezone('America/New_York')
+        self.pdt = _PDT
+        self.et = _ET
+        
+        # Latest streamed price per symbol as (price, monotonic receive time)
+        self._last_quote = {}
+        self._first_quote = threading.Event()
         
         # Initialize API clients
         self._setup_api_clients()
         
+        # Keep the quote cache fed from the websocket for the whole session
+        self._stream_thread = threading.Thread(target=self.stream.run, name="quote-stream", daemon=True)
+        self._stream_thread.start()
+        
         # Initialize notification handler
-        self.notifier = NotificationHandler()
+        self.notifier = get_notifier()
+        
+        # Independent REST lookups at decision points run side by side
+        self._io_pool = ThreadPoolExecutor(max_workers=4)
+        
+        # The bot runs one trading day per process, so today's date strings and
+        # the PDT schedule are fixed at startup
+        now_pdt = datetime.now(self.pdt)
+        self._today_str = now_pdt.strftime('%Y%m%d')
+        self._today_iso = now_pdt.strftime('%Y-%m-%d')
+        self._target_700 = now_pdt.replace(hour=7, minute=0, second=0, microsecond=0)
+        self._target_1259 = now_pdt.replace(hour=12, minute=59, second=0, microsecond=0)
         
         # Trading state
         self.open_price_630am = None
@@ -65,28 +137,49 @@ class TQQQSQQQTradingBot:
         self.position_symbol = None  # Track which symbol we bought
         self.position_opened = False
         self.today_trades = []
+        self.buy_price_by_symbol = {}  # Price of today's buy, for the close-out P&L
+        # Each trade is appended here (one JSON object per line) as it happens
+        os.makedirs(log_dir, exist_ok=True)
+        self._trade_ndjson_path = os.path.join(
+            log_dir, f"trade_data_{self._today_str}.ndjson"
+        )
+        
+        # Set on shutdown to abort any pending wait_until_time
+        self._shutdown_event = threading.Event()
+        self._progress_timer = None
         
         # Setup graceful shutdown
         signal.signal(signal.SIGTERM, self._handle_shutdown)
         signal.signal(signal.SIGINT, self._handle_shutdown)
         
         logger.info(f"TQQQ/SQQQ Trading Bot initialized - {'PAPER' if paper_trading else 'LIVE'} TRADING MODE")
-        logger.info(f"Current PDT time: {datetime.now(self.pdt).strftime('%Y-%m-%d %H:%M:%S PDT')}")
+        logger.info(f"Current PDT time: {now_pdt.strftime('%Y-%m-%d %H:%M:%S PDT')}")
         
         self.notifier.send_notification(
             "Bot Started", 
             f"TQQQ/SQQQ Trading Bot initialized in {'PAPER' if paper_trading else 'LIVE'} mode\n"
-            f"Time: {datetime.now(self.pdt).strftime('%Y-%m-%d %H:%M:%S PDT')}"
+            f"Time: {now_pdt.strftime('%Y-%m-%d %H:%M:%S PDT')}"
         )
     
     def _handle_shutdown(self, signum, frame):
         """Handle graceful shutdown"""
         logger.info("Received shutdown signal, cleaning up...")
+        self._shutdown_event.set()
         self.notifier.send_notification("Bot Shutdown", "Trading bot shutting down gracefully")
         sys.exit(0)
     
     def _setup_api_clients(self):
         """Set up Alpaca API clients"""
+        from dotenv import load_dotenv
+        from requests.adapters import HTTPAdapter
+        from alpaca.trading.client import TradingClient
+        from alpaca.data.historical import StockHistoricalDataClient
+        from alpaca.data.live import StockDataStream
+        from alpaca.data.requests import StockLatestQuoteRequest
+        
+        # Load environment variables
+        load_dotenv()
+        
         api_key = os.getenv('ALPACA_API_KEY')
         api_secret = os.getenv('ALPACA_API_SECRET')
         
@@ -107,6 +200,17 @@ class TQQQSQQQTradingBot:
         
         self.data_client = StockHistoricalDataClient(api_key, api_secret)
         
+        # Both clients keep one requests.Session for their lifetime; give each a
+        # small keep-alive pool so calls reuse the warm TLS connection
+        for client in (self.trading_client, self.data_client):
+            session = getattr(client, '_session', None)
+            if session is not None:
+                session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        
+        # Live quotes for both symbols; get_current_price reads from this feed
+        self.stream = StockDataStream(api_key, api_secret)
+        self.stream.subscribe_quotes(self._on_quote, self.tqqq_symbol, self.sqqq_symbol)
+        
         # Verify connection
         try:
             account = self.trading_client.get_account()
@@ -116,37 +220,98 @@ class TQQQSQQQTradingBot:
         except Exception as e:
             logger.error(f"Failed to connect to Alpaca: {e}")
             raise
+        
+        # Open the market data connection now so a REST price fallback doesn't
+        # pay for the TLS handshake
+        try:
+            self.data_client.get_stock_latest_quote(StockLatestQuoteRequest(symbol_or_symbols=self.tqqq_symbol))
+        except Exception as e:
+            logger.warning(f"Could not pre-warm market data connection: {e}")
+    
+    async def _on_quote(self, quote):
+        """Record the latest streamed quote (ask, or bid when there is no ask)"""
+        price = quote.ask_price or quote.bid_price
+        if price and price > 0:
+            self._last_quote[quote.symbol] = (float(price), time.monotonic())
+            self._first_quote.set()
+    
+    def _stop_stream(self):
+        """Close the quote stream (it may never have connected)"""
+        try:
+            if self.stream._loop is not None:
+                self.stream.stop()
+        except Exception as e:
+            logger.warning(f"Error stopping quote stream: {e}")
     
     def get_current_price(self, symbol):
-        """Get the current price of a symbol with retry logic"""
+        """Get the current price of a symbol (None if it couldn't be fetched)"""
+        return self.get_current_prices([symbol]).get(symbol)
+    
+    def get_current_prices(self, symbols):
+        """
+        Get current prices for several symbols as {symbol: price}
+        
+        Prices come from the quote stream; symbols without a fresh streamed
+        quote are fetched together in one REST request. Symbols that couldn't
+        be priced are left out.
+        """
+        if not self._first_quote.is_set():
+            self._first_quote.wait(STREAM_FIRST_QUOTE_WAIT)
+        
+        prices = {}
+        missing = []
+        now = time.monotonic()
+        for symbol in symbols:
+            cached = self._last_quote.get(symbol)
+            if cached is not None and now - cached[1] <= STREAM_QUOTE_MAX_AGE:
+                prices[symbol] = cached[0]
+                logger.info("Current %s price: $%.2f (stream)", symbol, cached[0])
+            else:
+                missing.append(symbol)
+        
+        if missing:
+            prices.update(self._get_rest_prices(missing))
+        return prices
+    
+    def _get_rest_prices(self, symbols):
+        """Get current prices for symbols over REST (one request per attempt) with retry logic"""
+        from alpaca.data.requests import StockLatestQuoteRequest
+        
         max_retries = 3
         retry_delay = 2
         
+        prices = {}
+        pending = list(symbols)
         for attempt in range(max_retries):
             try:
-                request = StockLatestQuoteRequest(symbol_or_symbols=symbol)
-                quote = self.data_client.get_stock_latest_quote(request)
+                request = StockLatestQuoteRequest(symbol_or_symbols=pending)
+                quotes = self.data_client.get_stock_latest_quote(request)
                 
-                if symbol in quote:
+                for symbol in pending:
+                    if symbol not in quotes:
+                        logger.error("No quote data for %s", symbol)
+                        continue
                     # Try ask price first, then bid price
-                    price = quote[symbol].ask_price
+                    price = quotes[symbol].ask_price
                     if price == 0 or price is None:
-                        price = quote[symbol].bid_price
+                        price = quotes[symbol].bid_price
                     
                     if price and price > 0:
-                        logger.info(f"Current {symbol} price: ${price:.2f}")
-                        return float(price)
+                        logger.info("Current %s price: $%.2f", symbol, price)
+                        prices[symbol] = float(price)
                     else:
-                        logger.warning(f"Invalid price for {symbol}: {price}")
-                else:
-                    logger.error(f"No quote data for {symbol}")
+                        logger.warning("Invalid price for %s: %s", symbol, price)
+                
+                pending = [symbol for symbol in pending if symbol not in prices]
+                if not pending:
+                    break
                     
             except Exception as e:
-                logger.error(f"Error getting price (attempt {attempt + 1}/{max_retries}): {e}")
+                logger.error("Error getting price (attempt %d/%d): %s", attempt + 1, max_retries, e)
                 if attempt < max_retries - 1:
                     time.sleep(retry_delay)
         
-        return None
+        return prices
     
     def is_market_open(self):
         """Check if the market is currently open"""
@@ -157,34 +322,52 @@ class TQQQSQQQTradingBot:
             logger.error(f"Error checking market status: {e}")
             return False
     
-    def wait_until_time(self, target_hour, target_minute):
-        """Wait until a specific time (in PDT)"""
+    def wait_until_time(self, target_time):
+        """Wait until target_time (a PDT datetime); returns False if it passed or the bot is shutting down"""
         now_pdt = datetime.now(self.pdt)
-        target_time = now_pdt.replace(hour=target_hour, minute=target_minute, second=0, microsecond=0)
         
         if now_pdt > target_time:
-            logger.warning(f"Target time {target_hour}:{target_minute:02d} PDT has already passed")
+            logger.warning("Target time %02d:%02d PDT has already passed", target_time.hour, target_time.minute)
             return False
         
         wait_seconds = (target_time - now_pdt).total_seconds()
-        logger.info(f"Waiting until {target_hour}:{target_minute:02d} PDT ({wait_seconds:.0f} seconds)...")
-        logger.info(f"Current time: {now_pdt.strftime('%H:%M:%S PDT')}")
-        
-        # Wait with periodic status updates
-        while wait_seconds > 0:
-            if wait_seconds > 60:
-                time.sleep(60)
-                wait_seconds -= 60
-                if int(wait_seconds) % 300 == 0:  # Update every 5 minutes
-                    logger.info(f"Still waiting... {wait_seconds/60:.0f} minutes remaining")
-            else:
-                time.sleep(wait_seconds)
-                break
+        logger.info("Waiting until %02d:%02d PDT (%.0f seconds)...", target_time.hour, target_time.minute, wait_seconds)
+        logger.info("Current time: %02d:%02d:%02d PDT", now_pdt.hour, now_pdt.minute, now_pdt.second)
         
-        return True
+        # Sleep once for the whole interval; a timer logs progress every 5 minutes
+        self._schedule_wait_progress(target_time)
+        try:
+            interrupted = self._shutdown_event.wait(timeout=wait_seconds)
+        finally:
+            self._progress_timer.cancel()
+        
+        return not interrupted
+    
+    def _schedule_wait_progress(self, target_time):
+        """Arm the next 5-minute progress log for wait_until_time"""
+        self._progress_timer = threading.Timer(300, self._log_waiting_progress, args=(target_time,))
+        self._progress_timer.daemon = True
+        self._progress_timer.start()
     
-    def place_order(self, symbol, side, quantity=None):
-        """Place a market order with error handling"""
+    def _log_waiting_progress(self, target_time):
+        """Log the remaining wait and re-arm the timer"""
+        remaining = (target_time - datetime.now(self.pdt)).total_seconds()
+        if remaining > 0 and not self._shutdown_event.is_set():
+            logger.info("Still waiting... %.0f minutes remaining", remaining / 60)
+            self._schedule_wait_progress(target_time)
+    
+    def place_order(self, symbol, side, quantity=None, ref_price=None):
+        """
+        Place a market order with error handling
+        
+        ref_price is the caller's latest quote, used for logging and trade
+        tracking. It may also be a zero-argument callable, which is only
+        resolved once the order is submitted, so a slow quote never delays the
+        order. The current price is looked up only when neither yields one.
+        """
+        from alpaca.trading.requests import MarketOrderRequest
+        from alpaca.trading.enums import OrderSide, TimeInForce
+        
         if quantity is None:
             quantity = self.quantity
         
@@ -202,84 +385,134 @@ class TQQQSQQQTradingBot:
             
             # Log and notify
             action = "BUY" if side == OrderSide.BUY else "SELL"
-            current_price = self.get_current_price(symbol)
+            if callable(ref_price):
+                ref_price = ref_price()
+            current_price = ref_price if ref_price is not None else self.get_current_price(symbol)
             
-            logger.info(f"Order placed: {action} {quantity} {symbol} at ~${current_price:.2f}")
-            logger.info(f"Order ID: {order.id}")
+            # The order is already in, so an unknown price only affects reporting
+            price_text = f"~${current_price:.2f}" if current_price else "market price (quote unavailable)"
+            
+            logger.info("Order placed: %s %s %s at %s", action, quantity, symbol, price_text)
+            logger.info("Order ID: %s", order.id)
             
             self.notifier.send_notification(
                 f"Trade Executed: {action} {symbol}",
-                f"{action} {quantity} share of {symbol} at ~${current_price:.2f}\n"
+                f"{action} {quantity} share of {symbol} at {price_text}\n"
                 f"Time: {datetime.now(self.pdt).strftime('%H:%M:%S PDT')}\n"
                 f"Order ID: {order.id}"
             )
             
             # Track trade
-            self.today_trades.append({
+            trade = {
                 'time': datetime.now(self.pdt),
                 'action': action,
                 'symbol': symbol,
                 'quantity': quantity,
                 'price': current_price,
                 'order_id': order.id
-            })
+            }
+            self.today_trades.append(trade)
+            self._record_trade(trade)
+            if side == OrderSide.BUY:
+                self.buy_price_by_symbol.setdefault(symbol, current_price)
             
             return order
             
         except Exception as e:
-            logger.error(f"Error placing order for {symbol}: {e}")
+            logger.error("Error placing order for %s: %s", symbol, e)
             self.notifier.send_notification(
                 "Order Failed", 
                 f"Failed to place {side} order for {symbol}: {str(e)}"
             )
             return None
     
+    def _record_trade(self, trade):
+        """Append one trade to today's NDJSON trade log"""
+        record = dict(trade, time=trade['time'].isoformat(), order_id=str(trade['order_id']))
+        try:
+            with open(self._trade_ndjson_path, 'ab') as f:
+                f.write(_dumps(record) + b"\n")
+        except OSError as e:
+            logger.error(f"Error recording trade: {e}")
+    
+    def _load_trade_records(self):
+        """Read back today's NDJSON trade log"""
+        try:
+            with open(self._trade_ndjson_path, 'rb') as f:
+                return [_loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+    
     def get_position(self, symbol):
         """Get current position for a symbol"""
+        from alpaca.common.exceptions import APIError
+        
         try:
-            positions = self.trading_client.get_all_positions()
-            for position in positions:
-                if position.symbol == symbol:
-                    return position
+            return self.trading_client.get_open_position(symbol)
+        except APIError as e:
+            # 404 just means there is no open position in this symbol
+            if e.status_code == 404:
+                return None
+            logger.error(f"Error getting position for {symbol}: {e}")
             return None
         except Exception as e:
             logger.error(f"Error getting position for {symbol}: {e}")
             return None
     
-    def capture_open_price(self):
-        """Capture the open price at 6:30 AM PDT"""
-        logger.info("=" * 60)
-        logger.info("Capturing market open price at 6:30 AM PDT...")
-        
-        self.open_price_630am = self.get_current_price(self.tqqq_symbol)
-        
-        if self.open_price_630am:
-            logger.info(f"✓ Open price captured at 6:30 AM PDT: ${self.open_price_630am:.2f}")
-            self.notifier.send_notification(
-                "Open Price Captured",
-                f"TQQQ open price at 6:30 AM PDT: ${self.open_price_630am:.2f}"
-            )
-            return True
-        else:
-            logger.error("✗ Failed to capture open price")
-            self.notifier.send_notification(
-                "Error: Open Price",
-                "Failed to capture TQQQ open price at 6:30 AM PDT"
-            )
-            return False
+    def _get_signal_snapshot(self):
+        """
+        Get TQQQ's 6:30 AM open and both symbols' current prices in one request
+        
+        Returns (open_price, {symbol: price}). The open is today's daily bar
+        open, the 6:30 AM PDT opening print, or None if the snapshot has no bar
+        for today. Symbols the snapshot couldn't price go through
+        get_current_prices.
+        """
+        from alpaca.data.requests import StockSnapshotRequest
+        
+        symbols = [self.tqqq_symbol, self.sqqq_symbol]
+        try:
+            snapshots = self.data_client.get_stock_snapshot(StockSnapshotRequest(symbol_or_symbols=symbols))
+        except Exception as e:
+            logger.error("Error getting snapshot: %s", e)
+            return None, self.get_current_prices(symbols)
+        
+        prices = {}
+        for symbol in symbols:
+            snapshot = snapshots.get(symbol)
+            quote = snapshot.latest_quote if snapshot else None
+            price = (quote.ask_price or quote.bid_price) if quote else None
+            if price and price > 0:
+                logger.info("Current %s price: $%.2f (snapshot)", symbol, price)
+                prices[symbol] = float(price)
+        
+        missing = [symbol for symbol in symbols if symbol not in prices]
+        if missing:
+            prices.update(self.get_current_prices(missing))
+        
+        # Daily bars are stamped at midnight ET; an older one is yesterday's session
+        snapshot = snapshots.get(self.tqqq_symbol)
+        bar = snapshot.daily_bar if snapshot else None
+        if bar is None or bar.timestamp.astimezone(self.et).date() != datetime.now(self.et).date():
+            logger.error("Snapshot has no daily bar for today's session")
+            return None, prices
+        return float(bar.open), prices
     
     def execute_entry_strategy(self):
         """Execute the entry strategy at 7:00 AM PDT"""
+        from alpaca.trading.enums import OrderSide
+        
         logger.info("=" * 60)
         logger.info("Executing entry strategy at 7:00 AM PDT...")
         
-        # Get current price at 7:00 AM
-        self.current_price_7am = self.get_current_price(self.tqqq_symbol)
+        # Today's open and the 7:00 AM prices (SQQQ alongside, in case the signal is SQQQ)
+        self.open_price_630am, prices = self._get_signal_snapshot()
+        self.current_price_7am = prices.get(self.tqqq_symbol)
         
         if not self.current_price_7am or not self.open_price_630am:
             logger.error("Cannot execute strategy - missing price data")
-            logger.error(f"Open price (6:30 AM): {self.open_price_630am}")
-            logger.error(f"Current price (7:00 AM): {self.current_price_7am}")
+            logger.error("Open price (6:30 AM): %s", self.open_price_630am)
+            logger.error("Current price (7:00 AM): %s", self.current_price_7am)
             self.notifier.send_notification(
                 "Strategy Error", 
                 "Missing price data for strategy execution"
@@ -290,96 +523,51 @@ class TQQQSQQQTradingBot:
         price_change = self.current_price_7am - self.open_price_630am
         price_change_pct = (price_change / self.open_price_630am) * 100
         
-        logger.info(f"Open Price (6:30 AM PDT): ${self.open_price_630am:.2f}")
-        logger.info(f"Current Price (7:00 AM PDT): ${self.current_price_7am:.2f}")
-        logger.info(f"Price Change: ${price_change:.2f} ({price_change_pct:+.2f}%)")
+        logger.info("Open Price (6:30 AM PDT): $%.2f", self.open_price_630am)
+        logger.info("Current Price (7:00 AM PDT): $%.2f", self.current_price_7am)
+        logger.info("Price Change: $%.2f (%+.2f%%)", price_change, price_change_pct)
         
         # Make trading decision based on the rule
         if self.current_price_7am > self.open_price_630am:
             # Price went up - BUY TQQQ
             logger.info("📈 SIGNAL: BUY TQQQ - Price increased since 6:30 AM")
-            order = self.place_order(self.tqqq_symbol, OrderSide.BUY)
+            order = self.place_order(self.tqqq_symbol, OrderSide.BUY, ref_price=self.current_price_7am)
             if order:
                 self.position_symbol = self.tqqq_symbol
                 self.position_opened = True
                 self.notifier.send_notification(
                     "📈 BUY TQQQ Signal",
-                    f"Bought 1 share of TQQQ at ${self.current_price_7am:.2f}\n"
-                    f"Price increased {price_change_pct:.2f}% since 6:30 AM open"
+                    self._TMPL_BUY_TQQQ.format(price=self.current_price_7am, pct=price_change_pct)
                 )
         else:
             # Price went down or stayed same - BUY SQQQ
             logger.info("📉 SIGNAL: BUY SQQQ - Price decreased or unchanged since 6:30 AM")
-            sqqq_price = self.get_current_price(self.sqqq_symbol)
-            if sqqq_price:
-                order = self.place_order(self.sqqq_symbol, OrderSide.BUY)
-                if order:
-                    self.position_symbol = self.sqqq_symbol
-                    self.position_opened = True
-                    self.notifier.send_notification(
-                        "📉 BUY SQQQ Signal",
-                        f"Bought 1 share of SQQQ at ${sqqq_price:.2f}\n"
-                        f"TQQQ price decreased {abs(price_change_pct):.2f}% since 6:30 AM open"
+            # The decision is made; a missing SQQQ quote must not hold up the order.
+            # place_order falls back to the stream cache for its report
+            order = self.place_order(self.sqqq_symbol, OrderSide.BUY, ref_price=prices.get(self.sqqq_symbol))
+            if order:
+                self.position_symbol = self.sqqq_symbol
+                self.position_opened = True
+                sqqq_price = self.buy_price_by_symbol.get(self.sqqq_symbol)
+                self.notifier.send_notification(
+                    "📉 BUY SQQQ Signal",
+                    (self._TMPL_BUY_SQQQ if sqqq_price else self._TMPL_BUY_SQQQ_UNPRICED).format(
+                        price=sqqq_price, pct=abs(price_change_pct)
                     )
-            else:
-                logger.error("Failed to get SQQQ price")
+                )
     
     def close_positions(self):
         """Close any open positions at 12:59 PM PDT"""
         logger.info("=" * 60)
         logger.info("Closing positions at 12:59 PM PDT...")
         
-        positions_closed = []
-        
-        # Check and close TQQQ position
-        tqqq_position = self.get_position(self.tqqq_symbol)
-        if tqqq_position and float(tqqq_position.qty) > 0:
-            current_price = self.get_current_price(self.tqqq_symbol)
-            qty = float(tqqq_position.qty)
-            
-            logger.info(f"Closing TQQQ position: {qty} shares at ${current_price:.2f}")
-            order = self.place_order(self.tqqq_symbol, OrderSide.SELL, quantity=qty)
-            
-            if order:
-                # Calculate P&L if we bought TQQQ today
-                if self.position_symbol == self.tqqq_symbol and self.current_price_7am:
-                    pnl = (current_price - self.current_price_7am) * qty
-                    pnl_pct = ((current_price - self.current_price_7am) / self.current_price_7am) * 100
-                    positions_closed.append(
-                        f"TQQQ: Sold {qty} shares at ${current_price:.2f}\n"
-                        f"P&L: ${pnl:+.2f} ({pnl_pct:+.2f}%)"
-                    )
-                else:
-                    positions_closed.append(f"TQQQ: Sold {qty} shares at ${current_price:.2f}")
-        
-        # Check and close SQQQ position
-        sqqq_position = self.get_position(self.sqqq_symbol)
-        if sqqq_position and float(sqqq_position.qty) > 0:
-            current_price = self.get_current_price(self.sqqq_symbol)
-            qty = float(sqqq_position.qty)
-            
-            logger.info(f"Closing SQQQ position: {qty} shares at ${current_price:.2f}")
-            order = self.place_order(self.sqqq_symbol, OrderSide.SELL, quantity=qty)
-            
-            if order:
-                # Calculate P&L if we bought SQQQ today
-                if self.position_symbol == self.sqqq_symbol:
-                    # Get the buy price from today's trades
-                    buy_price = None
-                    for trade in self.today_trades:
-                        if trade['symbol'] == self.sqqq_symbol and trade['action'] == 'BUY':
-                            buy_price = trade['price']
-                            break
-                    
-                    if buy_price:
-                        pnl = (current_price - buy_price) * qty
-                        pnl_pct = ((current_price - buy_price) / buy_price) * 100
-                        positions_closed.append(
-                            f"SQQQ: Sold {qty} shares at ${current_price:.2f}\n"
-                            f"P&L: ${pnl:+.2f} ({pnl_pct:+.2f}%)"
-                        )
-                    else:
-                        positions_closed.append(f"SQQQ: Sold {qty} shares at ${current_price:.2f}")
+        # Only the symbol bought today needs checking; probe both if that's unknown
+        # (e.g. after a restart). Each symbol's lookup -> sell runs as its own
+        # pipeline, side by side with the other and with the batched quote
+        symbols = [self.position_symbol] if self.position_symbol else [self.tqqq_symbol, self.sqqq_symbol]
+        f_prices = self._io_pool.submit(self.get_current_prices, symbols)
+        results = self._io_pool.map(lambda symbol: self._close_one(symbol, f_prices), symbols)
+        positions_closed = [result for result in results if result]
         
         # Send notification
         if positions_closed:
@@ -394,85 +582,103 @@ class TQQQSQQQTradingBot:
                 "No positions to close at 12:59 PM PDT"
             )
     
+    def _close_one(self, symbol, f_prices):
+        """Sell any open position in symbol; returns its report line, or None if nothing was sold"""
+        from alpaca.trading.enums import OrderSide
+        
+        position = self.get_position(symbol)
+        if not position or float(position.qty) <= 0:
+            return None
+        
+        qty = float(position.qty)
+        
+        # Submit the sell first; the batched quote is only needed for the report,
+        # so place_order resolves it after submission
+        logger.info("Closing %s position: %s shares", symbol, qty)
+        order = self.place_order(symbol, OrderSide.SELL, quantity=qty,
+                                 ref_price=lambda: f_prices.result().get(symbol))
+        if not order:
+            return None
+        
+        # Report the price place_order recorded for this sell, if it found one
+        current_price = next(
+            (trade['price'] for trade in reversed(self.today_trades) if trade['order_id'] == order.id), None
+        )
+        if not current_price:
+            return self._TMPL_SOLD_UNPRICED.format(symbol=symbol, qty=qty)
+        
+        # Calculate P&L if we bought this symbol today
+        buy_price = self.buy_price_by_symbol.get(symbol) if self.position_symbol == symbol else None
+        
+        if buy_price:
+            pnl = (current_price - buy_price) * qty
+            pnl_pct = ((current_price - buy_price) / buy_price) * 100
+            return self._TMPL_SOLD_PNL.format(symbol=symbol, qty=qty, price=current_price, pnl=pnl, pnl_pct=pnl_pct)
+        return self._TMPL_SOLD.format(symbol=symbol, qty=qty, price=current_price)
+    
     def generate_daily_summary(self):
         """Generate and send daily trading summary"""
         logger.info("=" * 60)
         logger.info("DAILY TRADING SUMMARY")
         
-        summary_lines = [
-            "TQQQ/SQQQ Trading Bot - Daily Summary",
-            f"Date: {datetime.now(self.pdt).strftime('%Y-%m-%d')}",
-            "=" * 40,
-            "",
-            "Market Data:",
-            f"  Open Price (6:30 AM PDT): ${self.open_price_630am:.2f}" if self.open_price_630am else "  Open Price: Not captured",
-            f"  7:00 AM Price: ${self.current_price_7am:.2f}" if self.current_price_7am else "  7:00 AM Price: Not captured",
-        ]
+        # Written straight into one buffer rather than collected into a list and joined
+        buf = io.StringIO()
+        buf.write("TQQQ/SQQQ Trading Bot - Daily Summary\n")
+        buf.write(f"Date: {self._today_iso}\n")
+        buf.write("=" * 40 + "\n")
+        buf.write("\n")
+        buf.write("Market Data:\n")
+        buf.write(f"  Open Price (6:30 AM PDT): ${self.open_price_630am:.2f}\n" if self.open_price_630am else "  Open Price: Not captured\n")
+        buf.write(f"  7:00 AM Price: ${self.current_price_7am:.2f}\n" if self.current_price_7am else "  7:00 AM Price: Not captured\n")
         
         if self.open_price_630am and self.current_price_7am:
             change = self.current_price_7am - self.open_price_630am
             change_pct = (change / self.open_price_630am) * 100
-            summary_lines.append(f"  Price Change: ${change:.2f} ({change_pct:+.2f}%)")
-            summary_lines.append(f"  Signal Generated: {'BUY TQQQ' if self.current_price_7am > self.open_price_630am else 'BUY SQQQ'}")
+            buf.write(f"  Price Change: ${change:.2f} ({change_pct:+.2f}%)\n")
+            buf.write(f"  Signal Generated: {'BUY TQQQ' if self.current_price_7am > self.open_price_630am else 'BUY SQQQ'}\n")
         
-        summary_lines.extend([
-            "",
-            f"Trades Executed: {len(self.today_trades)}",
-        ])
+        buf.write("\n")
+        buf.write(f"Trades Executed: {len(self.today_trades)}\n")
         
         for i, trade in enumerate(self.today_trades, 1):
-            summary_lines.extend([
-                f"",
-                f"Trade {i}:",
-                f"  Time: {trade['time'].strftime('%H:%M:%S PDT')}",
-                f"  Action: {trade['action']}",
-                f"  Symbol: {trade['symbol']}",
-                f"  Quantity: {trade['quantity']}",
-                f"  Price: ${trade['price']:.2f}" if trade['price'] else "  Price: N/A",
-            ])
+            buf.write(self._TMPL_SUMMARY_TRADE.format(n=i, **trade))
+            buf.write(self._TMPL_SUMMARY_PRICE.format(price=trade['price']) if trade['price'] else "  Price: N/A\n")
         
         # Get account info
         try:
             account = self.trading_client.get_account()
-            summary_lines.extend([
-                "",
-                "Account Status:",
-                f"  Buying Power: ${account.buying_power}",
-                f"  Portfolio Value: ${account.portfolio_value}",
-            ])
+            buf.write("\n")
+            buf.write("Account Status:\n")
+            buf.write(f"  Buying Power: ${account.buying_power}\n")
+            buf.write(f"  Portfolio Value: ${account.portfolio_value}\n")
         except Exception as e:
             logger.error(f"Error getting account info: {e}")
         
-        summary = "\n".join(summary_lines)
+        summary = buf.getvalue()
         logger.info(summary)
         self.notifier.send_notification("📊 Daily Summary", summary)
         
         # Save to file
-        summary_file = os.path.join(log_dir, f"trade_summary_{datetime.now(self.pdt).strftime('%Y%m%d')}.txt")
+        summary_file = os.path.join(log_dir, f"trade_summary_{self._today_str}.txt")
         with open(summary_file, 'w') as f:
             f.write(summary)
         
         # Also save as JSON for easier parsing
-        json_file = os.path.join(log_dir, f"trade_data_{datetime.now(self.pdt).strftime('%Y%m%d')}.json")
+        json_file = os.path.join(log_dir, f"trade_data_{self._today_str}.json")
         trade_data = {
-            'date': datetime.now(self.pdt).strftime('%Y-%m-%d'),
+            'date': self._today_iso,
             'open_price_630am': self.open_price_630am,
             'current_price_7am': self.current_price_7am,
             'position_symbol': self.position_symbol,
-            'trades': [
-                {
-                    'time': trade['time'].isoformat(),
-                    'action': trade['action'],
-                    'symbol': trade['symbol'],
-                    'quantity': trade['quantity'],
-                    'price': trade['price'],
-                    'order_id': trade['order_id']
-                }
-                for trade in self.today_trades
-            ]
+            # Already serialized as each trade happened
+            'trades': self._load_trade_records()
         }
-        with open(json_file, 'w') as f:
-            json.dump(trade_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(json_file, 'wb') as f:
+                f.write(orjson.dumps(trade_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_file, 'w') as f:
+                json.dump(trade_data, f, indent=2)
     
     def run(self):
         """Main execution loop"""
@@ -486,19 +692,13 @@ class TQQQSQQQTradingBot:
                 logger.warning("Market is currently closed")
                 # Continue anyway as we might be waiting for market open
             
-            # Capture open price at 6:30 AM PDT
-            if self.wait_until_time(6, 30):
-                # Wait a few seconds to ensure market data is available
-                time.sleep(5)
-                if not self.capture_open_price():
-                    logger.error("Failed to capture open price, but continuing...")
-            
-            # Execute entry strategy at 7:00 AM PDT
-            if self.wait_until_time(7, 0):
+            # Execute entry strategy at 7:00 AM PDT; the 6:30 AM open comes
+            # from the snapshot then, so there is no separate 6:30 stop
+            if self.wait_until_time(self._target_700):
                 self.execute_entry_strategy()
             
             # Close positions at 12:59 PM PDT
-            if self.wait_until_time(12, 59):
+            if self.wait_until_time(self._target_1259):
                 self.close_positions()
             
             # Generate daily summary
@@ -517,8 +717,13 @@ class TQQQSQQQTradingBot:
             logger.error(f"Unexpected error: {e}", exc_info=True)
             self.notifier.send_notification("Bot Error", f"Unexpected error: {str(e)}")
             raise
+        finally:
+            self._io_pool.shutdown(wait=False)
+            self._stop_stream()
 
 if __name__ == "__main__":
+    setup_logging()
+    
     # Default to paper trading for safety
     bot = TQQQSQQQTradingBot(paper_trading=True)
     bot.run()
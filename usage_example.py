@@ -5,12 +5,59 @@ Usage Examples for Alpaca BarSet Exploration
 This file demonstrates how to explore and visualize your Alpaca BarSet data.
 """
 
+import functools
 from datetime import datetime, timedelta
 from alpaca.data.historical import StockHistoricalDataClient
 from alpaca.data.requests import StockBarsRequest
 from alpaca.data.timeframe import TimeFrame
 from explore_alpaca_data import explore_barset, create_visualizations
 
+# TA-Lib computes the indicators in C when it is installed
+try:
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:
+    TALIB_AVAILABLE = False
+
+# Setup (use your existing credentials)
+API_KEY = "PKJCOVJ8NBAT2HVHKCSC"
+API_SECRET = "dm3BAs0Xh0qdctMB6BPMZyqHPIphB7gdVUoUqNyN"
+
+
+@functools.lru_cache(maxsize=1)
+def _data_client():
+    """Shared historical data client for the examples"""
+    return StockHistoricalDataClient(API_KEY, API_SECRET)
+
+
+def _cached_bars(symbol, start, end, timeframe):
+    """Fetch bars once per (symbol, start, end, timeframe) and reuse the BarSet"""
+    # TimeFrame.Day etc. build a new, identity-hashed object on each access, so
+    # key the cache on the timeframe's (amount, unit) instead
+    return _fetch_bars(symbol, start, end, timeframe.amount, timeframe.unit)
+
+
+@functools.lru_cache(maxsize=32)
+def _fetch_bars(symbol, start, end, amount, unit):
+    request_params = StockBarsRequest(
+        symbol_or_symbols=[symbol],
+        timeframe=TimeFrame(amount, unit),
+        start=start,
+        end=end
+    )
+    return _data_client().get_stock_bars(request_params)
+
+
+def _date_range(days):
+    """
+    Return (start, end) covering `days` days and ending 15 days ago (avoiding
+    recent data to prevent subscription issues). Both are whole days so
+    repeated calls produce the same _cached_bars key.
+    """
+    end_date = (datetime.now() - timedelta(days=15)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return end_date - timedelta(days=days), end_date
+
+
 # If you already have a BarSet object named 'df' from your notebook:
 # You can use it directly with the functions
 
@@ -53,25 +100,11 @@ def example_quick_exploration():
     print("EXAMPLE 2: Quick Exploration")
     print("=" * 60)
     
-    # Setup (use your existing credentials)
-    API_KEY = "PKJCOVJ8NBAT2HVHKCSC"
-    API_SECRET = "dm3BAs0Xh0qdctMB6BPMZyqHPIphB7gdVUoUqNyN"
-    
-    data_client = StockHistoricalDataClient(API_KEY, API_SECRET)
-    
     # Get historical data (avoiding recent data to prevent subscription issues)
-    end_date = datetime.now() - timedelta(days=15)
-    start_date = end_date - timedelta(days=30)
-    
-    request_params = StockBarsRequest(
-        symbol_or_symbols=["AAPL"],
-        timeframe=TimeFrame.Day,
-        start=start_date,
-        end=end_date
-    )
+    start_date, end_date = _date_range(30)
     
     # Fetch data
-    df = data_client.get_stock_bars(request_params)
+    df = _cached_bars("AAPL", start_date, end_date, TimeFrame.Day)
     
     # Explore the data structure
     explore_barset(df, "AAPL")
@@ -88,22 +121,9 @@ def example_visualization():
     print("=" * 60)
     
     # Get data
-    API_KEY = "PKJCOVJ8NBAT2HVHKCSC"
-    API_SECRET = "dm3BAs0Xh0qdctMB6BPMZyqHPIphB7gdVUoUqNyN"
-    
-    data_client = StockHistoricalDataClient(API_KEY, API_SECRET)
-    
-    end_date = datetime.now() - timedelta(days=15)
-    start_date = end_date - timedelta(days=60)  # Get more data for better visualization
+    start_date, end_date = _date_range(60)  # Get more data for better visualization
     
-    request_params = StockBarsRequest(
-        symbol_or_symbols=["AAPL"],
-        timeframe=TimeFrame.Day,
-        start=start_date,
-        end=end_date
-    )
-    
-    df = data_client.get_stock_bars(request_params)
+    df = _cached_bars("AAPL", start_date, end_date, TimeFrame.Day)
     
     # Create visualizations
     print("\nCreating interactive and static visualizations...")
@@ -127,23 +147,10 @@ def example_data_manipulation():
     import pandas as pd
     import numpy as np
     
-    # Get data
-    API_KEY = "PKJCOVJ8NBAT2HVHKCSC"
-    API_SECRET = "dm3BAs0Xh0qdctMB6BPMZyqHPIphB7gdVUoUqNyN"
-    
-    data_client = StockHistoricalDataClient(API_KEY, API_SECRET)
-    
-    end_date = datetime.now() - timedelta(days=15)
-    start_date = end_date - timedelta(days=30)
+    # Get data (same range as example 2, so it reuses that fetch)
+    start_date, end_date = _date_range(30)
     
-    request_params = StockBarsRequest(
-        symbol_or_symbols=["AAPL"],
-        timeframe=TimeFrame.Day,
-        start=start_date,
-        end=end_date
-    )
-    
-    barset = data_client.get_stock_bars(request_params)
+    barset = _cached_bars("AAPL", start_date, end_date, TimeFrame.Day)
     
     # Convert to DataFrame
     df = barset.df
@@ -154,28 +161,43 @@ def example_data_manipulation():
     else:
         aapl_df = df.copy()
     
+    # Some SDK versions hand back object-typed price columns; uniform float64
+    # keeps pct_change/rolling on NumPy's vectorized paths
+    aapl_df = aapl_df.astype({'open': 'float64', 'high': 'float64', 'low': 'float64',
+                              'close': 'float64', 'volume': 'float64'}, copy=False)
+    
     # Calculate technical indicators
     print("\nCalculating technical indicators...")
     
     # Daily returns
     aapl_df['daily_return'] = aapl_df['close'].pct_change()
     
-    # Moving averages
-    aapl_df['MA_5'] = aapl_df['close'].rolling(window=5).mean()
-    aapl_df['MA_20'] = aapl_df['close'].rolling(window=20).mean()
-    
-    # Bollinger Bands
-    rolling_mean = aapl_df['close'].rolling(window=20).mean()
-    rolling_std = aapl_df['close'].rolling(window=20).std()
-    aapl_df['BB_upper'] = rolling_mean + (rolling_std * 2)
-    aapl_df['BB_lower'] = rolling_mean - (rolling_std * 2)
-    
-    # RSI (Relative Strength Index)
-    delta = aapl_df['close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-    rs = gain / loss
-    aapl_df['RSI'] = 100 - (100 / (1 + rs))
+    if TALIB_AVAILABLE:
+        # One C pass per indicator over a contiguous float64 array. TA-Lib's
+        # Bollinger width uses the population std and its RSI uses Wilder
+        # smoothing, so values differ slightly from the pandas fallback
+        close = aapl_df['close'].to_numpy(dtype=np.float64)
+        aapl_df['MA_5'] = talib.SMA(close, timeperiod=5)
+        aapl_df['MA_20'] = talib.SMA(close, timeperiod=20)
+        aapl_df['BB_upper'], _, aapl_df['BB_lower'] = talib.BBANDS(close, timeperiod=20, nbdevup=2, nbdevdn=2)
+        aapl_df['RSI'] = talib.RSI(close, timeperiod=14)
+    else:
+        # Moving averages
+        aapl_df['MA_5'] = aapl_df['close'].rolling(window=5).mean()
+        aapl_df['MA_20'] = aapl_df['close'].rolling(window=20).mean()
+        
+        # Bollinger Bands
+        rolling_mean = aapl_df['MA_20']
+        rolling_std = aapl_df['close'].rolling(window=20).std()
+        aapl_df['BB_upper'] = rolling_mean + (rolling_std * 2)
+        aapl_df['BB_lower'] = rolling_mean - (rolling_std * 2)
+        
+        # RSI (Relative Strength Index)
+        delta = aapl_df['close'].diff()
+        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+        rs = gain / loss
+        aapl_df['RSI'] = 100 - (100 / (1 + rs))
     
     # Display results
     print("\nLast 5 rows with indicators:")
@@ -184,14 +206,14 @@ def example_data_manipulation():
     # Trading signals
     print("\nSimple Trading Signals:")
     
-    # Golden Cross (MA5 crosses above MA20)
-    aapl_df['signal'] = 0
-    aapl_df.loc[aapl_df['MA_5'] > aapl_df['MA_20'], 'signal'] = 1
-    aapl_df.loc[aapl_df['MA_5'] < aapl_df['MA_20'], 'signal'] = -1
+    # Golden Cross (MA5 crosses above MA20): +1 / -1, and 0 where equal or
+    # still warming up (NaN diff)
+    ma_diff = aapl_df['MA_5'].to_numpy() - aapl_df['MA_20'].to_numpy()
+    aapl_df['signal'] = np.sign(np.nan_to_num(ma_diff)).astype(np.int8)
     
     # Count signals
-    buy_signals = (aapl_df['signal'] == 1).sum()
-    sell_signals = (aapl_df['signal'] == -1).sum()
+    buy_signals = int((aapl_df['signal'] == 1).sum())
+    sell_signals = int((aapl_df['signal'] == -1).sum())
     
     print(f"  Buy signals (MA5 > MA20): {buy_signals}")
     print(f"  Sell signals (MA5 < MA20): {sell_signals}")